@@ -10,6 +10,7 @@ import asyncio
 import os
 import shutil
 import sys
+from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -27,6 +28,9 @@ class MockDatabase:
     def __init__(self):
         # store chunks by chunk_id
         self._chunks: Dict[str, CodeChunk] = {}
+        # secondary index: file path -> {chunk_id: content_hash}, kept in sync
+        # with _chunks so per-file lookups don't scan every stored chunk
+        self._by_file: Dict[str, Dict[str, str]] = defaultdict(dict)
 
     async def initialize(self):
         return
@@ -40,22 +44,28 @@ class MockDatabase:
         print("[MockDatabase] add_chunks called for", len(chunks), "chunks; thread env:", thread_vars)
         for c in chunks:
             self._chunks[c.chunk_id] = c
+            self._by_file[sys.intern(str(c.file_path))][c.chunk_id] = c.content_hash
 
     async def delete_by_file(self, file_path: Path) -> int:
-        to_delete = [k for k, v in self._chunks.items() if str(v.file_path) == str(file_path)]
+        to_delete = self._by_file.pop(str(file_path), {})
         for k in to_delete:
             del self._chunks[k]
         return len(to_delete)
 
     async def get_hashes_for_file(self, file_path: Path) -> Dict[str, str]:
-        result = {k: v.content_hash for k, v in self._chunks.items() if str(v.file_path) == str(file_path)}
-        return result
+        return dict(self._by_file.get(str(file_path), {}))
 
     async def delete_chunks(self, chunk_ids: List[str]) -> int:
         count = 0
         for cid in chunk_ids:
-            if cid in self._chunks:
-                del self._chunks[cid]
+            chunk = self._chunks.pop(cid, None)
+            if chunk is not None:
+                file_key = str(chunk.file_path)
+                file_hashes = self._by_file.get(file_key)
+                if file_hashes is not None:
+                    file_hashes.pop(cid, None)
+                    if not file_hashes:
+                        del self._by_file[file_key]
                 count += 1
         return count
 
@@ -63,9 +73,8 @@ class MockDatabase:
         return list(self._chunks.values())
 
     async def get_stats(self) -> IndexStats:
-        files = set(v.file_path for v in self._chunks.values())
         return IndexStats(
-            total_files=len(files),
+            total_files=len(self._by_file),
             total_chunks=len(self._chunks),
             languages={"python": len(self._chunks)},
             file_types={".py": len(self._chunks)},
@@ -99,6 +108,26 @@ class MockDatabase:
         return [sr]
 
 
+async def index_files_batch(indexer: SemanticIndexer, files: List[Path], label: str) -> int:
+    """Index all files in a single indexer batch and report per-file progress.
+
+    Files are not fanned out with asyncio.gather: each indexer batch performs a
+    read-modify-write of index_metadata.json, so concurrent batches would drop
+    each other's entries. Sizing the batch to the file list instead gives one
+    parse pass and a single add_chunks round trip for the whole set.
+    """
+    if not files:
+        return 0
+
+    indexer.batch_size = len(files)
+    indexed = 0
+    async for file_path, chunks_added, success in indexer.index_files_with_progress(files, force_reindex=False):
+        print(f"{label}: {file_path} -> chunks_added={chunks_added}, success={success}")
+        if success and chunks_added >= 0:
+            indexed += 1
+    return indexed
+
+
 async def run_dry_run():
     sample_root = REPO_ROOT / "demo_sample_repo"
     if sample_root.exists():
@@ -133,35 +162,21 @@ def helper():
 
     # Initialize mock DB and indexer
     mock_db = MockDatabase()
-    indexer = SemanticIndexer(
-        database=mock_db,
-        project_root=sample_root,
-        file_extensions=[".py"],
-        config=None,
-        max_workers=1,
-        batch_size=2,
-        embedding_batch_size=1,
-        onnx_num_threads=2,
-        use_multiprocessing=False,
-    )
+    indexer = SemanticIndexer(database=mock_db, project_root=sample_root, config=None)
+    indexer.file_extensions = {".py"}
+    indexer.max_workers = 1
+    indexer.embedding_batch_size = 1
+    indexer.onnx_num_threads = 2
+    indexer.use_multiprocessing = False
 
     print("--- First indexing run (should index files and apply ONNX thread limits) ---")
-    all_files, files_to_index = await indexer.get_files_to_index(force_reindex=False)
-    # Run incremental index flow with progress
-    indexed_total = 0
-    async for file_path, chunks_added, success in indexer.index_files_with_progress(files_to_index, force_reindex=False):
-        print(f"Indexed file: {file_path} -> chunks_added={chunks_added}, success={success}")
-        if success and chunks_added >= 0:
-            indexed_total += 1
+    files_to_index = indexer.get_files_to_index(force_reindex=False)
+    indexed_total = await index_files_batch(indexer, files_to_index, label="Indexed file")
     print("Indexed count (files):", indexed_total)
 
     print("--- Second indexing run (should skip files via content_hash) ---")
-    all_files2, files_to_index2 = await indexer.get_files_to_index(force_reindex=False)
-    indexed_total2 = 0
-    async for file_path, chunks_added, success in indexer.index_files_with_progress(files_to_index2, force_reindex=False):
-        print(f"Second run - file: {file_path} -> chunks_added={chunks_added}, success={success}")
-        if success and chunks_added >= 0:
-            indexed_total2 += 1
+    files_to_index2 = indexer.get_files_to_index(force_reindex=False)
+    indexed_total2 = await index_files_batch(indexer, files_to_index2, label="Second run - file")
     print("Indexed count on second run (expected 0):", indexed_total2)
 
     print("--- Querying semantic search for 'How do we handle ONNX threads?' ---")
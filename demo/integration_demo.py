@@ -6,24 +6,60 @@ python demo/integration_demo.py
 """
 import asyncio
 import os
-import shutil
+import re
 import sys
 import sqlite3
-import hashlib
+import zlib
+from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = REPO_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from mcp_code_intelligence.core.indexer import SemanticIndexer
-from mcp_code_intelligence.core.models import CodeChunk, SearchResult, IndexStats
+# Written as raw bytes: no text-mode encoding or newline translation, and the
+# file is LF-only on every platform
+SAMPLE_BYTES = (
+    b"\n"
+    b"# Example file discussing ONNX threading\n"
+    b"\n"
+    b"def configure_onnx_threads():\n"
+    b"    # We limit OMP/BLAS threads when running ONNX inference\n"
+    b"    pass\n"
+)
+
+# Bump when the relationships schema below changes; memory.db is rebuilt then
+MEMORY_SCHEMA_VERSION = 2
+
+MOCK_EMBED_DIM = 256
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _mock_embed(text: str) -> np.ndarray:
+    """Hashed bag-of-words vector, L2-normalized; stands in for a real model."""
+    vec = np.zeros(MOCK_EMBED_DIM, dtype=np.float32)
+    for token in _TOKEN_RE.findall(text.lower()):
+        vec[zlib.crc32(token.encode("utf-8")) % MOCK_EMBED_DIM] += 1.0
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
 
 # Minimal in-memory mock DB (same interface expected by SemanticIndexer)
 class MockDatabase:
     def __init__(self):
         self._chunks = {}
+        # secondary index: file path -> chunk ids, kept in sync with _chunks
+        self._by_file: dict[str, set[str]] = defaultdict(set)
+        # chunk id -> interned file path string, computed once per chunk
+        self._file_key: dict[str, str] = {}
+        # chunk id -> normalized embedding, computed once at insert time
+        self._vecs: dict[str, np.ndarray] = {}
+        # stacked embedding matrix (rows in _ids order), dropped on every write
+        self._emb = None
+        self._ids: list[str] = []
 
     async def initialize(self):
         return
@@ -33,23 +69,39 @@ class MockDatabase:
 
     async def add_chunks(self, chunks, metrics=None):
         print(f"[MockDatabase] add_chunks called for {len(chunks)} chunks")
+        self._emb = None
         for c in chunks:
+            file_key = sys.intern(str(c.file_path))
             self._chunks[c.chunk_id] = c
+            self._file_key[c.chunk_id] = file_key
+            self._by_file[file_key].add(c.chunk_id)
+            self._vecs[c.chunk_id] = _mock_embed(c.content)
 
     async def delete_by_file(self, file_path: Path):
-        to_delete = [k for k, v in self._chunks.items() if str(v.file_path) == str(file_path)]
+        to_delete = self._by_file.pop(str(file_path), ())
+        if to_delete:
+            self._emb = None
         for k in to_delete:
             del self._chunks[k]
+            del self._file_key[k]
+            del self._vecs[k]
         return len(to_delete)
 
     async def get_hashes_for_file(self, file_path: Path):
-        return {k: v.content_hash for k, v in self._chunks.items() if str(v.file_path) == str(file_path)}
+        return {k: self._chunks[k].content_hash for k in self._by_file.get(str(file_path), ())}
 
     async def delete_chunks(self, chunk_ids):
         count = 0
         for cid in chunk_ids:
-            if cid in self._chunks:
-                del self._chunks[cid]
+            if self._chunks.pop(cid, None) is not None:
+                self._emb = None
+                del self._vecs[cid]
+                file_key = self._file_key.pop(cid)
+                file_ids = self._by_file.get(file_key)
+                if file_ids is not None:
+                    file_ids.discard(cid)
+                    if not file_ids:
+                        del self._by_file[file_key]
                 count += 1
         return count
 
@@ -57,9 +109,10 @@ class MockDatabase:
         return list(self._chunks.values())
 
     async def get_stats(self):
-        files = set(v.file_path for v in self._chunks.values())
+        from mcp_code_intelligence.core.models import IndexStats
+
         return IndexStats(
-            total_files=len(files),
+            total_files=len(self._by_file),
             total_chunks=len(self._chunks),
             languages={"python": len(self._chunks)},
             file_types={".py": len(self._chunks)},
@@ -69,59 +122,80 @@ class MockDatabase:
             database_size_bytes=0,
         )
 
+    def _embedding_matrix(self):
+        # Rebuilt lazily after writes; searches between writes reuse it
+        if self._emb is None:
+            self._ids = list(self._chunks)
+            self._emb = (
+                np.vstack([self._vecs[cid] for cid in self._ids])
+                if self._ids
+                else np.empty((0, MOCK_EMBED_DIM), dtype=np.float32)
+            )
+        return self._emb
+
     async def search(self, query: str, limit: int = 10, filters: dict | None = None, similarity_threshold: float = 0.0):
-        chunks = list(self._chunks.values())
-        if not chunks:
+        from mcp_code_intelligence.core.models import SearchResult
+
+        emb = self._embedding_matrix()
+        if not self._ids or limit <= 0:
             return []
-        c = chunks[0]
-        sr = SearchResult(
-            content=c.content,
-            file_path=c.file_path,
-            start_line=c.start_line,
-            end_line=c.end_line,
-            language=c.language,
-            similarity_score=0.95,
-            rank=1,
-            chunk_type=c.chunk_type,
-            function_name=c.function_name,
-            class_name=c.class_name,
-            navigation_hint=f"{c.file_path}:{c.start_line}",
-            symbol_context=("function" if c.chunk_type in ("function","method") else "global"),
-        )
-        return [sr]
+
+        # Rows are L2-normalized, so one matrix-vector product gives cosine scores
+        scores = emb @ _mock_embed(query)
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        results = []
+        for idx in top:
+            score = float(scores[idx])
+            if score < similarity_threshold:
+                break
+            c = self._chunks[self._ids[idx]]
+            results.append(SearchResult(
+                content=c.content,
+                file_path=c.file_path,
+                start_line=c.start_line,
+                end_line=c.end_line,
+                language=c.language,
+                similarity_score=score,
+                rank=len(results) + 1,
+                chunk_type=c.chunk_type,
+                function_name=c.function_name,
+                class_name=c.class_name,
+                navigation_hint=f"{c.file_path}:{c.start_line}",
+                symbol_context=("function" if c.chunk_type in ("function","method") else "global"),
+            ))
+        return results
 
 
 async def run_integration():
+    # Imported here so the heavy indexing stack loads only when the demo runs
+    from mcp_code_intelligence.core.indexer import SemanticIndexer
+
     sample_root = REPO_ROOT / "demo_sample_repo"
-    if sample_root.exists():
-        shutil.rmtree(sample_root)
     (sample_root / "src").mkdir(parents=True, exist_ok=True)
 
+    # Reuse the sample tree from previous runs; only rewrite the file when its
+    # content differs so repeat runs don't touch the disk or wake file watchers
     f1 = sample_root / "src" / "onnx_handler.py"
-    f1.write_text("""
-# Example file discussing ONNX threading
-
-def configure_onnx_threads():
-    # We limit OMP/BLAS threads when running ONNX inference
-    pass
-""")
+    if not f1.exists() or f1.read_bytes() != SAMPLE_BYTES:
+        f1.write_bytes(SAMPLE_BYTES)
 
     mock_db = MockDatabase()
-    indexer = SemanticIndexer(
-        database=mock_db,
-        project_root=sample_root,
-        file_extensions=[".py"],
-        config=None,
-        max_workers=1,
-        batch_size=2,
-        embedding_batch_size=1,
-        onnx_num_threads=1,
-        use_multiprocessing=False,
-    )
+    indexer = SemanticIndexer(database=mock_db, project_root=sample_root, config=None)
+    indexer.file_extensions = {".py"}
+    indexer.max_workers = 1
+    indexer.batch_size = 2
+    indexer.embedding_batch_size = 1
+    indexer.onnx_num_threads = 1
+    indexer.use_multiprocessing = False
 
     print("--- Indexing sample files ---")
-    all_files, files_to_index = await indexer.get_files_to_index(force_reindex=False)
-    async for file_path, chunks_added, success in indexer.index_files_with_progress(files_to_index, force_reindex=False):
+    # The mock database starts empty on every run, so index even files whose
+    # metadata from a previous run says they are unchanged
+    files_to_index = indexer.get_files_to_index(force_reindex=True)
+    async for file_path, chunks_added, success in indexer.index_files_with_progress(files_to_index, force_reindex=True):
         print(f"Indexed {file_path}: chunks_added={chunks_added} success={success}")
 
     chunks = await mock_db.get_all_chunks()
@@ -129,46 +203,91 @@ def configure_onnx_threads():
         print("No chunks indexed; aborting demo")
         return
     c = chunks[0]
-    # determine content_hash
-    content_hash = getattr(c, "content_hash", None)
-    if not content_hash:
-        content_hash = hashlib.md5(c.content.encode("utf-8")).hexdigest()
+    # CodeChunk computes content_hash once in __post_init__; reuse it rather
+    # than hashing the content again here
+    content_hash = c.content_hash
 
     nav_hint = f"{c.file_path}:{c.start_line}"
     print("Indexed chunk navigation_hint=", nav_hint, " content_hash=", content_hash)
 
-    # Create a lightweight relationships DB for demo in the sample_root
+    # Lightweight relationships DB for the demo, kept across runs in sample_root
     mem_db_path = sample_root / "memory.db"
-    if mem_db_path.exists():
-        mem_db_path.unlink()
-    conn = sqlite3.connect(mem_db_path)
-    conn.execute('''
-        CREATE TABLE relationships (
-            key TEXT PRIMARY KEY,
-            source TEXT NOT NULL,
-            target TEXT NOT NULL,
-            source_id TEXT,
-            target_id TEXT,
-            relationship_type TEXT,
-            note TEXT,
-            navigation_hint TEXT,
-            content_hash TEXT,
-            symbol_type TEXT,
-            vector_id TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    conn.execute('CREATE INDEX idx_rel_content_hash ON relationships(content_hash)')
-    conn.execute('CREATE INDEX idx_rel_nav ON relationships(navigation_hint)')
+    conn = sqlite3.connect(mem_db_path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # map up to 256 MB of the file
 
     rel_key = 'rel:demo1'
     note = 'This function is performance-critical; ONNX thread limits are managed here.'
-    conn.execute(
-        'INSERT INTO relationships (key, source, target, note, navigation_hint, content_hash, relationship_type, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)',
-        (rel_key, 'onnx_handler', 'configure_onnx_threads', note, nav_hint, content_hash, 'performance')
-    )
-    conn.commit()
+    rows = [
+        (rel_key, 'onnx_handler', 'configure_onnx_threads', note, nav_hint, content_hash, 'performance'),
+    ]
+
+    # The connection is in autocommit mode, so schema setup and every insert
+    # share one explicit write transaction instead of sqlite3's implicit BEGINs
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        if conn.execute("PRAGMA user_version").fetchone()[0] != MEMORY_SCHEMA_VERSION:
+            conn.execute('DROP TABLE IF EXISTS relationships')
+            conn.execute('DROP TABLE IF EXISTS rel_fts')
+            conn.execute('''
+                CREATE TABLE relationships (
+                    key TEXT PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    target TEXT NOT NULL,
+                    source_id TEXT,
+                    target_id TEXT,
+                    relationship_type TEXT,
+                    note TEXT,
+                    navigation_hint TEXT,
+                    content_hash TEXT,
+                    symbol_type TEXT,
+                    vector_id TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                ) WITHOUT ROWID
+            ''')
+            # Covering index: the recall query below is answered from the index alone
+            conn.execute('CREATE INDEX idx_rel_content_hash ON relationships(content_hash, key, source, target, note)')
+            conn.execute('CREATE INDEX idx_rel_nav ON relationships(navigation_hint)')
+            # Full-text index for the navigation_hint fallback. relationships is
+            # WITHOUT ROWID, so rows are tied to the FTS table by key via triggers.
+            # (Separate execute() calls: executescript() would COMMIT first.)
+            conn.execute("CREATE VIRTUAL TABLE rel_fts USING fts5(key UNINDEXED, navigation_hint, note, tokenize='unicode61')")
+            conn.execute('''
+                CREATE TRIGGER rel_fts_ai AFTER INSERT ON relationships BEGIN
+                    INSERT INTO rel_fts (key, navigation_hint, note) VALUES (new.key, new.navigation_hint, new.note);
+                END
+            ''')
+            conn.execute('''
+                CREATE TRIGGER rel_fts_ad AFTER DELETE ON relationships BEGIN
+                    DELETE FROM rel_fts WHERE key = old.key;
+                END
+            ''')
+            conn.execute('''
+                CREATE TRIGGER rel_fts_au AFTER UPDATE ON relationships BEGIN
+                    UPDATE rel_fts SET key = new.key, navigation_hint = new.navigation_hint, note = new.note WHERE key = old.key;
+                END
+            ''')
+            conn.execute(f'PRAGMA user_version = {MEMORY_SCHEMA_VERSION}')
+
+        # One prepared statement for every row; rows left by an earlier run
+        # are updated in place
+        conn.executemany(
+            'INSERT INTO relationships (key, source, target, note, navigation_hint, content_hash, relationship_type) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT(key) DO UPDATE SET source = excluded.source, target = excluded.target, '
+            'note = excluded.note, navigation_hint = excluded.navigation_hint, '
+            'content_hash = excluded.content_hash, relationship_type = excluded.relationship_type, '
+            'updated_at = CURRENT_TIMESTAMP',
+            rows,
+        )
+        conn.execute('COMMIT')
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
 
     # Now simulate a vector query
     print('--- Running semantic query ---')
@@ -185,8 +304,13 @@ def configure_onnx_threads():
     if row:
         print('Recall by content_hash found:', row)
     else:
-        # fallback to navigation_hint LIKE
-        cursor = conn.execute('SELECT key, source, target, note FROM relationships WHERE navigation_hint LIKE ?', (f"%{r.navigation_hint}%",))
+        # fallback to a full-text phrase match on navigation_hint
+        phrase = r.navigation_hint.replace('"', '""')
+        cursor = conn.execute(
+            'SELECT r.key, r.source, r.target, r.note FROM rel_fts JOIN relationships AS r ON r.key = rel_fts.key '
+            'WHERE rel_fts MATCH ?',
+            (f'navigation_hint : "{phrase}"',),
+        )
         row2 = cursor.fetchone()
         if row2:
             print('Recall by navigation_hint found:', row2)
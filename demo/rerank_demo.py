@@ -11,17 +11,20 @@ SRC_PATH = REPO_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from mcp_code_intelligence.core.search import SemanticSearchEngine
-from mcp_code_intelligence.core.models import SearchResult
-
 # Minimal mock DB returning two results with different initial scores
 class MockDB:
     async def search(self, query, limit=10, filters=None, similarity_threshold=0.0):
+        from mcp_code_intelligence.core.models import SearchResult
+
         r1 = SearchResult(content="def foo(): pass", file_path=Path("a.py"), start_line=1, end_line=1, language="python", similarity_score=0.6, rank=1, chunk_type="function", function_name="foo", class_name=None)
         r2 = SearchResult(content="def bar(): pass", file_path=Path("b.py"), start_line=1, end_line=1, language="python", similarity_score=0.5, rank=2, chunk_type="function", function_name="bar", class_name=None)
         return [r1, r2]
 
 async def main():
+    # Imported here: core.search pulls in the embedding/reranker stack, which
+    # is slow to load and not needed until the engine is built
+    from mcp_code_intelligence.core.search import SemanticSearchEngine
+
     db = MockDB()
     engine = SemanticSearchEngine(database=db, project_root=Path('.'), reranker_model_name='jinaai/jina-reranker-v2-base-multilingual')
     results = await engine.search('performance critical function', limit=2)
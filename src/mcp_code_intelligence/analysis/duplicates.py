@@ -30,10 +30,13 @@ class DuplicateDetector:
             Dictionary containing reports for all levels.
         """
         logger.info(f"Yüksek hassasiyetli kopya kod analizi başlatıldı (Min boy: {min_length} karakter)")
-        all_chunks = await self.database.get_all_chunks()
-        
-        # Filter noise/tiny chunks
-        filtered_chunks = [c for c in all_chunks if len(c.content.strip()) >= min_length]
+        # Stream chunks and filter noise/tiny chunks as they arrive, so only the
+        # chunks worth analyzing are kept in memory
+        filtered_chunks = [
+            c
+            async for c in self.database.iter_chunks()
+            if len(c.content.strip()) >= min_length
+        ]
         
         # Level 3: Exact Matches (SQLite + MD5/SHA256)
         exact = await self._find_exact_duplicates(filtered_chunks)
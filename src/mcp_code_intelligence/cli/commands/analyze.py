@@ -772,7 +772,7 @@ def _find_analyzable_files(
     Returns:
         List of file paths to analyze
     """
-    import fnmatch
+    import os
 
     # If git_changed_files is provided, use it as the primary filter
     if git_changed_files is not None:
@@ -839,42 +839,44 @@ def _find_analyzable_files(
     supported_extensions = parser_registry.get_supported_extensions()
 
     # Common ignore patterns
-    ignore_patterns = {
-        ".git",
-        ".venv",
-        "venv",
-        "node_modules",
-        "__pycache__",
-        ".pytest_cache",
-        "dist",
-        "build",
-        ".tox",
-        ".eggs",
-    }
-
-    for file_path in base_path.rglob("*"):
-        # Skip directories
-        if file_path.is_dir():
-            continue
+    ignore_patterns = frozenset(
+        {
+            ".git",
+            ".venv",
+            "venv",
+            "node_modules",
+            "__pycache__",
+            ".pytest_cache",
+            "dist",
+            "build",
+            ".tox",
+            ".eggs",
+        }
+    )
+    ignore_prefixes = tuple(ignore_patterns)
 
-        # Skip ignored directories
-        if any(
-            ignored in file_path.parts or fnmatch.fnmatch(file_path.name, f"{ignored}*")
-            for ignored in ignore_patterns
-        ):
-            continue
+    for root, dirs, filenames in os.walk(base_path):
+        # Prune ignored directories in place so os.walk never descends into them
+        dirs[:] = [d for d in dirs if d not in ignore_patterns]
 
-        # Check if file extension is supported
-        if file_path.suffix.lower() not in supported_extensions:
-            continue
+        for name in filenames:
+            # Skip files named after ignored entries (e.g. build.log, dist-info)
+            if name.startswith(ignore_prefixes):
+                continue
 
-        # Apply language filter
-        if language_filter:
-            parser = parser_registry.get_parser_for_file(file_path)
-            if parser.language.lower() != language_filter.lower():
+            # Check if file extension is supported
+            if os.path.splitext(name)[1].lower() not in supported_extensions:
                 continue
 
-        files.append(file_path)
+            file_path = Path(root) / name
+
+            # Apply language filter
+            if language_filter:
+                parser = parser_registry.get_parser_for_file(file_path)
+                if parser.language.lower() != language_filter.lower():
+                    continue
+
+            files.append(file_path)
 
     return sorted(files)
 
@@ -69,6 +69,7 @@ async def run_indexing(
     database = ChromaVectorDatabase(persist_directory=config.index_path, embedding_function=embedding_function)
 
     indexer = SemanticIndexer(database=database, project_root=project_root, config=config)
+    indexer.batch_size = batch_size
 
     try:
         async with database:
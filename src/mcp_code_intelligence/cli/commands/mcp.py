@@ -16,9 +16,11 @@ from rich.table import Table
 
 from ...core.exceptions import ProjectNotFoundError
 from ...core.project import ProjectManager
+from ...utils.atomic_write import atomic_write_json
 from ..didyoumean import create_enhanced_typer
 from ..output import print_error, print_info, print_success, print_warning
 
+
 # Create MCP subcommand app with "did you mean" functionality
 mcp_app = create_enhanced_typer(
     help="""🤖 Manage MCP integration for AI tools
@@ -261,8 +263,7 @@ def create_project_claude_config(
     }
 
     # Write the config
-    with open(mcp_config_path, "w") as f:
-        json.dump(config, f, indent=2)
+    atomic_write_json(mcp_config_path, config)
 
     print_success("Created project-level .mcp.json with MCP server configuration")
 
@@ -368,8 +369,7 @@ def configure_auggie_mcp(
     config["mcpServers"][server_name] = server_config
 
     # Write updated config
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
+    atomic_write_json(config_path, config)
 
     print_success(f"✅ Configured Auggie at {config_path}")
     return True
@@ -517,8 +517,7 @@ def configure_gemini_mcp(
     config["mcpServers"][server_name] = server_config
 
     # Write updated config
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
+    atomic_write_json(config_path, config)
 
     print_success(f"✅ Configured Gemini at {config_path}")
     return True
@@ -1224,8 +1223,7 @@ def remove_mcp_integration(
             del config["mcpServers"]
 
         # Write updated configuration
-        with open(mcp_config_path, "w") as f:
-            json.dump(config, f, indent=2)
+        atomic_write_json(mcp_config_path, config)
 
         print_success(f"✅ MCP server '{server_name}' removed from .mcp.json!")
         print_info("The server is no longer available for this project")
@@ -1,48 +1,55 @@
 
 
+# This module is imported for every CLI invocation (including --help), so
+# anything only a single command needs is imported inside that command.
+from __future__ import annotations
+
 # Standard library imports
+import functools
 import sys
 import shutil
 from pathlib import Path
-from typing import List, Optional
-import time
-import subprocess
-import os
-import asyncio
+from typing import TYPE_CHECKING, Optional
 import json
 
 # Third-party imports
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
-from rich.live import Live
-from rich.layout import Layout
-from rich.text import Text
 
 # Internal imports (relative to cli/commands)
 from ...core.project import ProjectManager
 from ...config.defaults import get_language_from_extension
+from ...utils.atomic_write import atomic_write_json
 
-# Import from py-mcp-installer library
-try:
-    from py_mcp_installer import (
-        MCPInstaller,
-        MCPServerConfig,
-        Platform,
-        PlatformDetector,
-        PlatformInfo,
-    )
-except ImportError:
-    sys.exit("Error: py_mcp_installer not found. Run this within the installed environment.")
+if TYPE_CHECKING:
+    from py_mcp_installer import MCPServerConfig, PlatformInfo
 
 console = Console()
 app = typer.Typer(help="Onboarding and setup for standard MCP servers")
 
-def detect_platforms() -> List[PlatformInfo]:
-    """Detect all available platforms on the system using py_mcp_installer."""
-    detector = PlatformDetector()
-    detected_platforms = []
+def _mcp_installer():
+    """Import the py-mcp-installer library on first use."""
+    try:
+        import py_mcp_installer
+    except ImportError:
+        sys.exit("Error: py_mcp_installer not found. Run this within the installed environment.")
+    return py_mcp_installer
+
+@functools.cache
+def detect_platforms() -> tuple[PlatformInfo, ...]:
+    """Detect all available platforms on the system using py_mcp_installer.
+
+    The probes only stat client config locations, which don't change during a
+    CLI run, so the result is computed once per process and returned as a
+    tuple every caller can share. Call ``detect_platforms.cache_clear()`` to
+    force a fresh scan.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    mcp_installer = _mcp_installer()
+    Platform = mcp_installer.Platform
+    detector = mcp_installer.PlatformDetector()
 
     # Map of platform enums to their detection methods
     platform_detectors = {
@@ -55,28 +62,33 @@ def detect_platforms() -> List[PlatformInfo]:
         Platform.GEMINI_CLI: detector.detect_gemini_cli,
     }
 
-    for platform_enum, detector_func in platform_detectors.items():
+    def _run_detector(item):
+        platform_enum, detector_func = item
         try:
             confidence, config_path = detector_func()
-            if confidence > 0.0 and config_path:
-                 detected_platforms.append(
-                    PlatformInfo(
-                        platform=platform_enum,
-                        confidence=confidence,
-                        config_path=config_path,
-                        cli_available=False
-                    )
-                )
         except Exception:
-            continue
-
-
+            return None
+        if confidence > 0.0 and config_path:
+            return mcp_installer.PlatformInfo(
+                platform=platform_enum,
+                confidence=confidence,
+                config_path=config_path,
+                cli_available=False
+            )
+        return None
 
-    return detected_platforms
+    # Detectors are I/O-bound filesystem probes; run them side by side.
+    # map() yields results in submission order, so the output stays stable.
+    with ThreadPoolExecutor(max_workers=len(platform_detectors)) as executor:
+        return tuple(
+            info
+            for info in executor.map(_run_detector, platform_detectors.items())
+            if info is not None
+        )
 
 def install_server(platform_info: PlatformInfo, config: MCPServerConfig) -> bool:
     """Install a generic server configuration to a platform."""
-    installer = MCPInstaller(platform=platform_info.platform)
+    installer = _mcp_installer().MCPInstaller(platform=platform_info.platform)
     try:
         console.print(f"[dim]  Installing {config.name} to {platform_info.platform.value}...[/dim]")
         result = installer.install_server(
@@ -100,6 +112,52 @@ def install_server(platform_info: PlatformInfo, config: MCPServerConfig) -> bool
         console.print(f"  ❌ Error installing {config.name}: {e}")
         return False
 
+# Last process listing as (monotonic timestamp, [(pid, cmdline), ...])
+_PROC_CACHE: tuple[float, list] | None = None
+_PROC_CACHE_TTL = 2.0
+
+def _process_cmdlines() -> list:
+    """Return ``(pid, cmdline)`` pairs for running processes.
+
+    Best-effort: psutil when available, otherwise the raw lines of
+    tasklist/ps output (with no pid). A listing is reused for
+    ``_PROC_CACHE_TTL`` seconds so repeated status checks don't respawn ps.
+    """
+    global _PROC_CACHE
+    import time
+
+    now = time.monotonic()
+    if _PROC_CACHE is not None and now - _PROC_CACHE[0] < _PROC_CACHE_TTL:
+        return _PROC_CACHE[1]
+
+    import os
+    import subprocess
+
+    # Attempt to detect running processes with best-effort method:
+    # 1. Try psutil for reliable cmdline and pid access
+    # 2. Fallback to tasklist/ps output search
+    proc_cmdlines = []
+    try:
+        import psutil
+
+        # Only fetch what the status match needs; each extra attr is another
+        # /proc read (or NT API call) per process
+        for p in psutil.process_iter(attrs=["pid", "cmdline"]):
+            cmd = " ".join(p.info.get("cmdline") or [])
+            proc_cmdlines.append((p.info.get("pid"), cmd))
+    except Exception:
+        try:
+            if os.name == "nt":
+                raw = subprocess.check_output(["tasklist", "/v", "/fo", "csv"]).decode("cp1254", errors="ignore")
+            else:
+                raw = subprocess.check_output(["ps", "aux"]).decode("utf-8", errors="ignore")
+            proc_cmdlines = [(None, line) for line in raw.splitlines()]
+        except Exception:
+            proc_cmdlines = []
+
+    _PROC_CACHE = (now, proc_cmdlines)
+    return proc_cmdlines
+
 @app.command("setup")
 def setup(
     allowed_path: Path = typer.Option(
@@ -113,7 +171,10 @@ def setup(
     Interactive Setup Wizard: Guided configuration for your AI intelligence tools.
     """
     import os
-    import json
+    import subprocess
+    from importlib.util import find_spec
+
+    MCPServerConfig = _mcp_installer().MCPServerConfig
     console.print(Panel.fit("🚀 [bold]MCP Intelligence Setup Wizard[/bold]\n[dim]I will help you configure your AI assistant correctly.[/dim]", border_style="cyan"))
 
     # 1. Ask for languages
@@ -128,16 +189,18 @@ def setup(
     console.print("\n[bold yellow]⚙️ Initializing Setup...[/bold yellow]")
 
     python_cmd = sys.executable
-    import subprocess
+    resolved_path = str(allowed_path.resolve())
 
     servers_to_install = []
+    # Optional packages to pip install, collected so pip runs only once
+    missing_packages: list[str] = []
 
     # Main Intelligence Server (Always)
     servers_to_install.append(MCPServerConfig(
         name="mcp-code-intelligence",
         command=python_cmd,
         args=["-m", "mcp_code_intelligence.mcp", "mcp"],
-        env={"MCP_PROJECT_ROOT": str(allowed_path.resolve()), "MCP_ENABLE_FILE_WATCHING": "true"},
+        env={"MCP_PROJECT_ROOT": resolved_path, "MCP_ENABLE_FILE_WATCHING": "true"},
         description="Semantic Search (Jina v3)"
     ))
 
@@ -145,15 +208,15 @@ def setup(
     if "python" in languages:
         lsp_already_added = any(s.name == "python-lsp" for s in servers_to_install)
         if not lsp_already_added:
-            try:
-                import pylsp
-            except ImportError:
-                console.print("[dim]📦 Installing Python LSP...[/dim]")
-                subprocess.run([python_cmd, "-m", "pip", "install", "python-lsp-server"], check=True, capture_output=True)
+            # find_spec only locates the package; importing pylsp would
+            # pull in jedi/rope just to check it is there
+            if find_spec("pylsp") is None:
+                console.print("[dim]📦 Python LSP will be installed[/dim]")
+                missing_packages.append("python-lsp-server")
             servers_to_install.append(MCPServerConfig(
                 name="python-lsp",
                 command=python_cmd,
-                args=["-m", "mcp_code_intelligence.servers.python_lsp_server", str(allowed_path.resolve())],
+                args=["-m", "mcp_code_intelligence.servers.python_lsp_server", resolved_path],
                 env={},
                 description="LSP (Type Intel)"
             ))
@@ -162,23 +225,21 @@ def setup(
     servers_to_install.append(MCPServerConfig(
         name="filesystem",
         command=python_cmd,
-        args=["-m", "mcp_code_intelligence.servers.filesystem_server", str(allowed_path.resolve())],
+        args=["-m", "mcp_code_intelligence.servers.filesystem_server", resolved_path],
         env={},
         description="Filesystem Access"
     ))
 
     # Optional Git
     if install_git:
-        try:
-            import git
-        except ImportError:
-            console.print("[dim]📦 Installing GitPython...[/dim]")
-            subprocess.run([python_cmd, "-m", "pip", "install", "gitpython"], check=True, capture_output=True)
+        if find_spec("git") is None:
+            console.print("[dim]📦 GitPython will be installed[/dim]")
+            missing_packages.append("gitpython")
 
         servers_to_install.append(MCPServerConfig(
             name="git",
             command=python_cmd,
-            args=["-m", "mcp_code_intelligence.servers.git_server", str(allowed_path.resolve())],
+            args=["-m", "mcp_code_intelligence.servers.git_server", resolved_path],
             env={},
             description="Git Operations"
         ))
@@ -193,6 +254,10 @@ def setup(
             description="Knowledge Memory"
         ))
 
+    if missing_packages:
+        console.print(f"[dim]📦 Installing {', '.join(missing_packages)}...[/dim]")
+        subprocess.run([python_cmd, "-m", "pip", "install", *missing_packages], check=True, capture_output=True)
+
     # --- ACTION: Writing local config ---
     console.print(f"\n[bold blue]Writing Workspace Configuration...[/bold blue]")
     local_mcp_path = allowed_path / ".mcp" / "mcp.json"
@@ -202,9 +267,10 @@ def setup(
     for s in servers_to_install:
         config_data["mcpServers"][s.name] = {"command": s.command, "args": s.args, "env": s.env}
 
-    with open(local_mcp_path, 'w', encoding='utf-8') as f:
-        json.dump(config_data, f, indent=2)
-    console.print(f"  ✅ [green]Updated .mcp/mcp.json[/green]")
+    if atomic_write_json(local_mcp_path, config_data):
+        console.print(f"  ✅ [green]Updated .mcp/mcp.json[/green]")
+    else:
+        console.print(f"  ✅ [green].mcp/mcp.json already up to date[/green]")
 
     # --- ACTION: Global ---
     if global_install:
@@ -216,7 +282,7 @@ def setup(
         else:
             for p in platforms:
                 console.print(f"  Configuring [cyan]{p.platform.value}[/cyan]...")
-                for s in servers:
+                for s in servers_to_install:
                      install_server(p, s)
 
         # Global AI client config handling (legacy Roo references removed)
@@ -229,10 +295,12 @@ def setup(
             for rp in roo_paths:
                 if rp.exists():
                     try:
-                        with open(rp, 'r') as f: data = json.load(f)
-                        data.setdefault("mcpServers", {}).update({s.name: {"command": s.command, "args": s.args, "env": s.env} for s in servers})
-                        with open(rp, 'w') as f: json.dump(data, f, indent=2)
-                        console.print(f"  ✅ [green]Updated global MCP config[/green]")
+                        data = json.loads(rp.read_bytes())
+                        data.setdefault("mcpServers", {}).update({s.name: {"command": s.command, "args": s.args, "env": s.env} for s in servers_to_install})
+                        if atomic_write_json(rp, data):
+                            console.print(f"  ✅ [green]Updated global MCP config[/green]")
+                        else:
+                            console.print(f"  ✅ [green]Global MCP config already up to date[/green]")
                         break
                     except Exception: continue
 
@@ -257,6 +325,15 @@ def view_logs(
     for a `.mcp-code-intelligence/logs/activity.log` file that contains data.
     If none is found, it falls back to the current working directory.
     """
+    import os
+    import threading
+    import time
+
+    from rich.layout import Layout
+    from rich.live import Live
+    from rich.table import Table
+    from rich.text import Text
+
     # Resolve project_root: prefer explicit, otherwise search upwards for a non-empty log
     def _find_active_log(start: Path) -> Path | None:
         # Walk up parent chain looking for .mcp-code-intelligence/logs/activity.log
@@ -310,43 +387,13 @@ def view_logs(
         {"name": "memory", "pattern": "memory_server"},
     ]
 
-    def check_server_status():
-        # Render a compact status table without a large title so the
-        # header doesn't redraw big box-drawing characters repeatedly.
-        table = Table(expand=True, box=None)
-        table.add_column("Server Name", style="bold white")
-        table.add_column("Status", justify="center")
-        table.add_column("PID", justify="right", style="dim")
-        table.add_column("Active Context", style="dim")
+    # Last rendered status table, keyed by the per-server (running, pid) state
+    status_cache: dict = {"state": None, "table": None}
 
-        # Attempt to detect running processes with best-effort method:
-        # 1. Try psutil for reliable cmdline and pid access
-        # 2. Fallback to tasklist/ps output search
-        proc_cmdlines = []
-        try:
-            import psutil
-
-            for p in psutil.process_iter(attrs=["pid", "name", "cmdline"]):
-                try:
-                    cmd = " ".join(p.info.get("cmdline") or [])
-                except Exception:
-                    cmd = ""
-                proc_cmdlines.append((p.info.get("pid"), cmd))
-        except Exception:
-            try:
-                if os.name == "nt":
-                    raw = subprocess.check_output(["tasklist", "/v", "/fo", "csv"]).decode("cp1254", errors="ignore")
-                    proc_cmdlines = []
-                    for line in raw.splitlines():
-                        proc_cmdlines.append((None, line))
-                else:
-                    raw = subprocess.check_output(["ps", "aux"]).decode("utf-8", errors="ignore")
-                    proc_cmdlines = []
-                    for line in raw.splitlines():
-                        proc_cmdlines.append((None, line))
-            except Exception:
-                proc_cmdlines = []
+    def check_server_status():
+        proc_cmdlines = _process_cmdlines()
 
+        state = []
         for s in servers:
             found_pid = None
             is_running = False
@@ -356,13 +403,31 @@ def view_logs(
                     if pid:
                         found_pid = pid
                         break
+            state.append((is_running, found_pid))
+        state = tuple(state)
 
+        # Nothing changed since the last frame: reuse the built table
+        if state == status_cache["state"]:
+            return status_cache["table"]
+
+        # Render a compact status table without a large title so the
+        # header doesn't redraw big box-drawing characters repeatedly.
+        table = Table(expand=True, box=None)
+        table.add_column("Server Name", style="bold white")
+        table.add_column("Status", justify="center")
+        table.add_column("PID", justify="right", style="dim")
+        table.add_column("Active Context", style="dim")
+
+        cwd = str(Path.cwd())
+        for s, (is_running, found_pid) in zip(servers, state, strict=True):
             status = "[bold green]● RUNNING[/bold green]" if is_running else "[bold red]○ STOPPED[/bold red]"
             pid_display = str(found_pid) if found_pid else ("ACTIVE" if is_running else "N/A")
             # Active context: show project root for running servers
-            active_ctx = str(Path.cwd()) if is_running else "-"
+            active_ctx = cwd if is_running else "-"
             table.add_row(s["name"], status, pid_display, active_ctx)
 
+        status_cache["state"] = state
+        status_cache["table"] = table
         return table
 
     def _sanitize(text: str) -> str:
@@ -378,12 +443,19 @@ def view_logs(
         return cleaned
 
 
-    def get_logs(limit=20):
+    def get_logs(limit=20, tail_bytes=16384):
+        # Read only a bounded window from the end of the log so each refresh
+        # costs the same however large activity.log has grown
         try:
-            with open(log_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                raw = "".join(lines[-limit:])
-                return _sanitize(raw)
+            with open(log_file, "rb") as f:
+                end = f.seek(0, os.SEEK_END)
+                start = max(0, end - tail_bytes)
+                f.seek(start)
+                lines = f.read().decode("utf-8", errors="replace").splitlines()
+            if start > 0 and lines:
+                # The window most likely begins mid-line
+                lines = lines[1:]
+            return _sanitize("\n".join(lines[-limit:]))
         except:
             return "Gathering log data..."
 
@@ -400,23 +472,54 @@ def view_logs(
     )
     console.print(header_panel)
 
+    # Re-read the log only when it changes: a watchdog observer on the log
+    # directory flags writes, so an idle HUD does no file I/O. Falls back to
+    # 0.5s polling if the observer cannot be started.
+    log_changed = threading.Event()
+    log_changed.set()
+    observer = None
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        class _LogFileHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                paths = (event.src_path, getattr(event, "dest_path", ""))
+                if any(os.path.basename(p) == log_file.name for p in paths if p):
+                    log_changed.set()
+
+        observer = Observer()
+        observer.schedule(_LogFileHandler(), str(log_file.parent), recursive=False)
+        observer.start()
+    except Exception:
+        observer = None
+
     with Live(layout, refresh_per_second=2, screen=False, console=console) as live:
         try:
             while True:
-                # Update Body each loop
-                log_data = get_logs(30)
-                layout["body"].update(
-                    Panel(
-                        Text(log_data),
-                        title="📝 Activity Stream",
-                        subtitle="Press Ctrl+C to Exit",
-                        border_style="dim",
+                if observer is None or log_changed.is_set():
+                    log_changed.clear()
+                    log_data = get_logs(30)
+                    layout["body"].update(
+                        Panel(
+                            Text(log_data),
+                            title="📝 Activity Stream",
+                            subtitle="Press Ctrl+C to Exit",
+                            border_style="dim",
+                        )
                     )
-                )
 
-                time.sleep(0.5)
+                if observer is not None:
+                    # Bounded wait keeps Ctrl+C responsive on every platform
+                    log_changed.wait(timeout=1.0)
+                else:
+                    time.sleep(0.5)
         except KeyboardInterrupt:
             pass
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
 
 @app.command("install-standard-servers")
 def install_standard_servers(allowed_path: Path = Path.cwd()):
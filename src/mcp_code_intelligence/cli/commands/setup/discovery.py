@@ -1,17 +1,37 @@
+import functools
 import shutil
 import time
 from pathlib import Path
 from loguru import logger
 from ....core.project import ProjectManager
-from ....config.defaults import get_language_from_extension
+from ....config.defaults import LANGUAGE_MAPPINGS, get_language_from_extension
 from ..install import detect_all_platforms
 
+# Text formats kept by the extension scan even though they map to "text"
+_TEXT_EXTENSIONS = (".txt", ".md", ".rst")
+# Every extension the scan can report; once all are seen, walking further
+# cannot change the result
+_KNOWN_EXTENSIONS = frozenset(
+    ext for ext, lang in LANGUAGE_MAPPINGS.items() if lang != "text"
+) | frozenset(_TEXT_EXTENSIONS)
+# Plenty to pick languages from; stop scanning beyond this
+_MAX_SCAN_EXTENSIONS = 50
+
+
+@functools.cache
+def _on_path(executable: str) -> bool:
+    """Check PATH for an executable once per process; PATH is fixed for a run."""
+    return shutil.which(executable) is not None
+
+
 class DiscoveryManager:
     """Manages project analysis and environment discovery."""
 
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.project_manager = ProjectManager(project_root)
+        # (project_root mtime_ns, result) of the last complete extension scan
+        self._ext_cache: tuple[int | None, list[str] | None] | None = None
 
     def detect_languages(self) -> list[str]:
         """Detect project languages using ProjectManager."""
@@ -21,50 +41,85 @@ class DiscoveryManager:
         """Scan project for unique file extensions with timeout.
 
         Optimized to skip ignored directories (node_modules, venv, etc.)
-        to avoid timeouts on large projects.
+        to avoid timeouts on large projects. A complete scan is cached and
+        reused until the project root's mtime changes. That mtime only moves
+        when entries directly under the root are added, removed or renamed,
+        so files added inside subdirectories are not noticed until then.
         """
         import os
+
+        try:
+            root_mtime = self.project_root.stat().st_mtime_ns
+        except OSError:
+            root_mtime = None
+        if self._ext_cache is not None and self._ext_cache[0] == root_mtime:
+            cached = self._ext_cache[1]
+            return list(cached) if cached is not None else None
+
         extensions: set[str] = set()
-        start_time = time.time()
+        # Every extension already classified, kept or not; the set of
+        # distinct extensions is tiny next to the file count
+        classified: set[str] = set()
+        deadline = time.monotonic() + timeout
         file_count = 0
+        saturated = False
+        timed_out = False
 
         logger.debug(f"Starting optimized file scan in {self.project_root}")
 
         try:
             for root, dirs, files in os.walk(self.project_root, topdown=True):
                 # Check timeout
-                if time.time() - start_time > timeout:
-                    logger.warning(f"File extension scan timed out after {timeout}s")
-                    if extensions:
-                        logger.info(f"Returning partial results: {len(extensions)} extensions found")
-                        return sorted(extensions)
-                    return None
+                if time.monotonic() > deadline:
+                    timed_out = True
+                    break
 
                 # Optimization: Filter directories IN-PLACE to skip ignored ones
                 # This prevents os.walk from even entering these directories
                 dirs[:] = [
                     d for d in dirs
-                    if not self.project_manager._should_ignore_path(Path(root) / d, is_directory=True)
+                    if not self.project_manager._should_ignore_dir(root, d)
                 ]
 
                 for file in files:
-                    file_path = Path(root) / file
-                    
-                    # Extension check
-                    ext = file_path.suffix
-                    if ext:
+                    file_count += 1
+                    # Extension check on the bare name; no Path per file
+                    ext = os.path.splitext(file)[1]
+                    if ext and ext not in classified:
+                        classified.add(ext)
                         language = get_language_from_extension(ext)
-                        if language != "text" or ext in [".txt", ".md", ".rst"]:
+                        if language != "text" or ext in _TEXT_EXTENSIONS:
                             extensions.add(ext)
-                    
-                    file_count += 1
-                    if file_count % 1000 == 0:
-                        # Periodic timeout check for very large directories of files
-                        if time.time() - start_time > timeout:
-                            break
+                            if (
+                                len(extensions) >= _MAX_SCAN_EXTENSIONS
+                                or _KNOWN_EXTENSIONS <= extensions
+                            ):
+                                saturated = True
+                                break
+
+                    # Periodic timeout check for very large directories of files;
+                    # reading the clock every 1024 files keeps it off the hot path
+                    if file_count & 0x3FF == 0 and time.monotonic() > deadline:
+                        timed_out = True
+                        break
+
+                if saturated:
+                    logger.debug("Extension scan saturated, stopping early")
+                    break
+                if timed_out:
+                    break
+
+            if timed_out:
+                logger.warning(f"File extension scan timed out after {timeout}s")
+                if extensions:
+                    logger.info(f"Returning partial results: {len(extensions)} extensions found")
+                    return sorted(extensions)
+                return None
 
             logger.debug(f"Scan complete: {file_count} files searched, {len(extensions)} extensions found")
-            return sorted(extensions) if extensions else None
+            result = sorted(extensions) if extensions else None
+            self._ext_cache = (root_mtime, result)
+            return list(result) if result is not None else None
         except Exception as e:
             logger.error(f"File extension scan failed: {e}")
             return None
@@ -75,11 +130,11 @@ class DiscoveryManager:
 
     def check_claude_cli(self) -> bool:
         """Check if Claude CLI is available."""
-        return shutil.which("claude") is not None
+        return _on_path("claude")
 
     def check_uv(self) -> bool:
         """Check if uv is available."""
-        return shutil.which("uv") is not None
+        return _on_path("uv")
 
     def is_idx(self) -> bool:
         """Detect if running in Google IDX environment."""
@@ -1,3 +1,4 @@
+import functools
 import sys
 import os
 import shutil
@@ -16,8 +17,16 @@ class IntelligenceManager:
         self.console = console
         self.python_cmd = sys.executable
 
-    def get_lsp_configs(self) -> dict:
-        """Returns the supported LSP configurations."""
+    @functools.cached_property
+    def lsp_configs(self) -> dict:
+        """Supported LSP configurations, keyed by lowercased language name.
+
+        ``language`` names the ``languages/<key>.json`` entry for configs that
+        are plain stdio language servers; these are what ``.mcp/mcp.json`` ->
+        ``languageLsps`` lists. Python's entry is an MCP server of its own
+        and has none. Built once per manager; the registry is static for a
+        project.
+        """
         return {
             "python": {
                 "id": "python-lsp",
@@ -26,27 +35,32 @@ class IntelligenceManager:
             },
             "javascript/typescript": {
                 "id": "js-ts-lsp",
+                "language": "javascript",
                 "cmd": "typescript-language-server",
                 "args": ["--stdio"],
                 "win_cmd": "typescript-language-server.cmd"
             },
             "dart/flutter": {
                 "id": "dart-lsp",
+                "language": "dart",
                 "cmd": "dart",
                 "args": ["language-server", "--stdio"]
             },
             "rust": {
                 "id": "rust-lsp",
+                "language": "rust",
                 "cmd": "rust-analyzer",
                 "args": []
             },
             "go": {
                 "id": "go-lsp",
+                "language": "go",
                 "cmd": "gopls",
                 "args": ["serve"]
             },
             "c/c++": {
                 "id": "cpp-lsp",
+                "language": "cpp",
                 "cmd": "clangd",
                 "args": []
             }
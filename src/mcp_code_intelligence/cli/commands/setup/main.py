@@ -1,14 +1,14 @@
 import asyncio
+import functools
 import sys
-import json
 import os
 import shutil
 import time
 from pathlib import Path
+import orjson
 from loguru import logger
 import typer
 from rich.console import Console
-from mcp_code_intelligence.core.languages import SUPPORTED_LANGUAGES as available_lsps
 
 from .discovery import DiscoveryManager
 from .intelligence import IntelligenceManager
@@ -16,11 +16,46 @@ from .mcp_config import MCPConfigManager
 from .wizard import SetupWizard
 from ....core.exceptions import ProjectInitializationError
 from ...output import print_error, print_info, print_success, print_warning
-from collections import Counter
-from ....core.project import ProjectManager
-from ....config.defaults import get_language_from_extension
+from types import MappingProxyType
+
+# Files inspected when guessing the project's main language
+_LANG_SAMPLE_FILES = 5000
+
+# Bundled language definitions (languages/*.json)
+LANGUAGES_DIR = Path(__file__).parent.parent.parent.parent / "languages"
+
+
+@functools.lru_cache(maxsize=128)
+def _which(cmd: str) -> str | None:
+    """Memoized shutil.which; PATH does not change during setup."""
+    return shutil.which(cmd)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_available_langs(langs_dir: Path) -> MappingProxyType:
+    """Parse the language JSON files in ``langs_dir`` once per process.
+
+    Returns a read-only mapping of lowercased language name to its config.
+    """
+    available_langs = {}
+    try:
+        # scandir reuses the directory entry's file type instead of a stat per match
+        with os.scandir(langs_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                    data = orjson.loads(Path(entry.path).read_bytes())
+                    available_langs[data["name"].lower()] = data
+    except FileNotFoundError:
+        pass
+    return MappingProxyType(available_langs)
 
 async def run_setup_workflow(ctx: typer.Context, force: bool, verbose: bool):
+    # Setup-only imports stay here so other CLI commands don't pay for them
+    import itertools
+    from collections import Counter
+    from ....core.project import ProjectManager
+    from ....config.defaults import get_language_from_extension
+
     # Pre-flight dependency check
     import importlib.util
     missing = []
@@ -53,23 +88,20 @@ async def run_setup_workflow(ctx: typer.Context, force: bool, verbose: bool):
     platforms = discovery.detect_ai_platforms()
 
     # Projedeki en yaygın dili otomatik tespit et
+    # A sample is enough to find the dominant language on large trees
     pm = ProjectManager(project_root)
-    file_langs = []
-    for file_path in pm._iter_source_files():
-        lang = get_language_from_extension(file_path.suffix)
-        if lang and lang != "text":
-            file_langs.append(lang.lower())
-    if not file_langs:
-        main_lang = "python"
-    else:
-        main_lang = Counter(file_langs).most_common(1)[0][0]
+    lang_counts = Counter(
+        lang.lower()
+        for file_path in itertools.islice(pm._iter_source_files(), _LANG_SAMPLE_FILES)
+        if (lang := get_language_from_extension(file_path.suffix)) and lang != "text"
+    )
+    main_lang = lang_counts.most_common(1)[0][0] if lang_counts else "python"
     print_info(f"\nProjenin ana dili otomatik tespit edildi: {main_lang}")
     selected_langs = [main_lang.capitalize() if main_lang == "python" else main_lang.title()]
 
     # Node.js ve npm kontrolü (JS/TS için)
-    import shutil as _shutil
     if any(l in ["JavaScript", "TypeScript"] for l in languages):
-        if not _shutil.which("npm"):
+        if not _which("npm"):
             print_warning("\n⚠️  TypeScript/JavaScript desteği için Node.js ve npm bulunamadı!\nLütfen https://nodejs.org adresinden Node.js kurun veya --force ile devam edin.\n")
             if not force:
                 if not typer.confirm("Node.js/npm olmadan devam etmek istiyor musunuz? (JS/TS LSP kurulamaz)", default=False):
@@ -77,7 +109,7 @@ async def run_setup_workflow(ctx: typer.Context, force: bool, verbose: bool):
                     return
     # Java kontrolü (JDTLS için)
     if "Java" in languages:
-        if not _shutil.which("java"):
+        if not _which("java"):
             print_warning("\n⚠️  Java desteği için Java JDK bulunamadı!\nLütfen https://adoptium.net/ adresinden JDK kurun veya --force ile devam edin.\n")
             if not force:
                 if not typer.confirm("Java olmadan devam etmek istiyor musunuz? (Java LSP kurulamaz)", default=False):
@@ -90,13 +122,7 @@ async def run_setup_workflow(ctx: typer.Context, force: bool, verbose: bool):
     configurable = [p for p in platforms if p.platform not in EXCLUDED]
 
     # 2. Planlama: Sadece ana dili yükle
-    available_langs = {}
-    langs_dir = Path(__file__).parent.parent.parent.parent / "languages"
-    if langs_dir.exists():
-        for f in langs_dir.glob("*.json"):
-            with open(f) as ld:
-                data = json.load(ld)
-                available_langs[data["name"].lower()] = data
+    available_langs = _load_available_langs(LANGUAGES_DIR)
     # Sadece ana dilin datasını ekle
     detected_lang_names = [main_lang.capitalize() if main_lang == "python" else main_lang.title()]
     if not selected_langs:
@@ -110,19 +136,22 @@ async def run_setup_workflow(ctx: typer.Context, force: bool, verbose: bool):
     # Normalize selected languages for matching
     normalized_selected = [s.lower() for s in selected_langs]
 
-    for name_key, data in available_langs.items():
-        config_name = data["name"].lower()
+    selected_set = set(normalized_selected)
+    for config_name, data in available_langs.items():
+        # Keys are already lowercased language names.
         # Check if config_name is in selected_langs or if any selected_lang is in config_name
         # (e.g., "javascript" should match "javascript/typescript")
-        if any(s in config_name or config_name in s for s in normalized_selected):
+        if config_name in selected_set or any(
+            s in config_name or config_name in s for s in normalized_selected
+        ):
             selected_langs_data.append(data)
             planned_lsp.append(data['name'])
             logger.debug(f"Matched language config: {data['name']} for selected: {selected_langs}")
 
     python_cmd = sys.executable
+    project_root_str = str(project_root.resolve())
     # Determine command for main server
-    import shutil
-    mcp_cmd = shutil.which("mcp-code-intelligence")
+    mcp_cmd = _which("mcp-code-intelligence")
     if mcp_cmd:
         # Use the installed CLI command which is cleaner and more portable
         server_cmd = "mcp-code-intelligence"
@@ -137,17 +166,17 @@ async def run_setup_workflow(ctx: typer.Context, force: bool, verbose: bool):
             "command": server_cmd,
             "args": server_args,
             "env": {
-                "MCP_PROJECT_ROOT": str(project_root.resolve()),
+                "MCP_PROJECT_ROOT": project_root_str,
                 "MCP_ENABLE_FILE_WATCHING": "true",
             }
         },
         "filesystem": {
             "command": python_cmd,
-            "args": ["-m", "mcp_code_intelligence.servers.filesystem_server", str(project_root.resolve())]
+            "args": ["-m", "mcp_code_intelligence.servers.filesystem_server", project_root_str]
         },
         "git": {
             "command": python_cmd,
-            "args": ["-m", "mcp_code_intelligence.servers.git_server", str(project_root.resolve())]
+            "args": ["-m", "mcp_code_intelligence.servers.git_server", project_root_str]
         },
         "memory": {
             "command": python_cmd,
@@ -156,17 +185,22 @@ async def run_setup_workflow(ctx: typer.Context, force: bool, verbose: bool):
     }
 
     # Add dynamic LSPs (Tekrar başlatmayı önle)
-    lsp_registry = intel.get_lsp_configs()
+    lsp_registry = intel.lsp_configs
+    is_windows = os.name == 'nt'
+    # .mcp/mcp.json -> languageLsps: {language: {"command", "args"}} for LSPManager
+    language_lsps: dict[str, dict] = {}
     for lp in planned_lsp:
-        low = lp.lower()
-        if low in lsp_registry:
-            cfg = lsp_registry[low]
-            lsp_id = cfg["id"]
-            if lsp_id in mcp_servers:
-                continue  # Aynı LSP zaten eklenmişse tekrar ekleme
-            cmd = cfg.get("win_cmd", cfg["cmd"]) if os.name == 'nt' else cfg["cmd"]
-            if shutil.which(cmd) or cfg["cmd"] == python_cmd:
-                mcp_servers[lsp_id] = {"command": cmd, "args": cfg["args"]}
+        cfg = lsp_registry.get(lp.lower())
+        if not cfg:
+            continue
+        lsp_id = cfg["id"]
+        if lsp_id in mcp_servers:
+            continue  # Aynı LSP zaten eklenmişse tekrar ekleme
+        cmd = cfg.get("win_cmd", cfg["cmd"]) if is_windows else cfg["cmd"]
+        if _which(cmd) or cfg["cmd"] == python_cmd:
+            mcp_servers[lsp_id] = {"command": cmd, "args": cfg["args"]}
+            if "language" in cfg:
+                language_lsps[cfg["language"]] = {"command": cmd, "args": list(cfg["args"])}
 
     # 3. Present Summary
     planned_actions = [
@@ -195,7 +229,7 @@ async def run_setup_workflow(ctx: typer.Context, force: bool, verbose: bool):
     print_info("🚀 Initializing system...")
     embedding_model = "jinaai/jina-embeddings-v3"
     discovery.project_manager.initialize(
-        file_extensions=list(set((extensions or []) + [e for ld in selected_langs_data for e in ld.get("extensions", [])])),
+        file_extensions=list({*(extensions or []), *(e for ld in selected_langs_data for e in ld.get("extensions", []))}),
         embedding_model=embedding_model,
         similarity_threshold=0.5,
         force=force
@@ -209,13 +243,17 @@ async def run_setup_workflow(ctx: typer.Context, force: bool, verbose: bool):
     from ..index import run_indexing
     try:
         await run_indexing(project_root=project_root, force_reindex=force, show_progress=True)
+    except ProjectInitializationError:
+        # The project itself is unusable; linking tools to it would only
+        # point them at a broken index
+        raise
     except Exception as e:
         print_error(f"Indexing failed: {e}")
 
     # Config Injection
     print_info("\n🔗 Linking AI tools...")
-    mcp_man.write_local_config(mcp_servers, available_lsps)
-    mcp_man.inject_global_config(configurable, mcp_servers)
+    mcp_man.write_local_config(mcp_servers, language_lsps)
+    await mcp_man.inject_global_config(configurable, mcp_servers)
 
     # Universal Rule Injection (All AI assistants)
     mcp_man.inject_universal_rules(mcp_servers)
@@ -239,18 +277,6 @@ async def run_setup_workflow(ctx: typer.Context, force: bool, verbose: bool):
         mcp_man.inject_cursor_rules(mcp_servers)
         mcp_man.inject_copilot_instructions(mcp_servers)
 
-    # Start LSP proxies for any available external LSPs so MCP can route requests
-    try:
-        from ...core.lsp_proxy import start_proxies
-
-        # start_proxies is async; run in event loop
-        try:
-            asyncio.get_event_loop().run_until_complete(start_proxies(project_root))
-        except RuntimeError:
-            # If there is already a running loop (e.g., in some contexts), create a task
-            asyncio.create_task(start_proxies(project_root))
-    except Exception as e:
-        logger.debug(f"Could not start LSP proxies: {e}")
     mcp_man.setup_git_hooks()
 
     # Finish
@@ -262,24 +288,32 @@ async def run_setup_workflow(ctx: typer.Context, force: bool, verbose: bool):
     # MCP sunucularını otomatik başlat (Düzeltilmiş girinti)
     print_info("\n🚦 MCP sunucuları başlatılıyor...")
     import subprocess
+
+    def _launch(server_cfg: dict) -> subprocess.Popen:
+        cmd = [server_cfg["command"]] + server_cfg["args"]
+        env = {**os.environ, **server_cfg.get("env", {})}
+        # Sunucuyu arka planda başlat
+        return subprocess.Popen(cmd, env=env, cwd=str(project_root))
+
+    # Servers are independent processes: spawn them side by side so startup
+    # costs the slowest fork/exec rather than the sum of all of them
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_launch, server_cfg) for server_cfg in mcp_servers.values()),
+        return_exceptions=True,
+    )
     started_servers = []
-    for server_name, server_cfg in mcp_servers.items():
-        try:
-            cmd = [server_cfg["command"]] + server_cfg["args"]
-            env = os.environ.copy()
-            env.update(server_cfg.get("env", {}))
-            # Sunucuyu arka planda başlat
-            subprocess.Popen(cmd, env=env, cwd=str(project_root))
+    for server_name, result in zip(mcp_servers, results, strict=True):
+        if isinstance(result, Exception):
+            print_error(f"{server_name} başlatılamadı: {result}")
+        else:
             started_servers.append(server_name)
             print_success(f"Başlatıldı: {server_name}")
-        except Exception as e:
-            print_error(f"{server_name} başlatılamadı: {e}")
     print_info(f"\nToplam başlatılan sunucu: {len(started_servers)} → {', '.join(started_servers)}")
 
 async def main_setup_task(ctx: typer.Context, force: bool, verbose: bool):
     try:
         await run_setup_workflow(ctx, force, verbose)
     except Exception as e:
-        logger.error(f"Setup error: {e}")
+        # Report once on the console; KeyboardInterrupt/SystemExit pass through
         print_error(f"Setup failed: {e}")
         raise typer.Exit(1)
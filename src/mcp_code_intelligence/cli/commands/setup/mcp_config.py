@@ -1,8 +1,93 @@
-import json
+import asyncio
 import os
+import string
 from pathlib import Path
+import orjson
+from loguru import logger
 from rich.console import Console
 from ....core.git_hooks import GitHookManager
+from ....utils.atomic_write import atomic_write_json
+
+
+def _write_text_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` unless the file already holds it. Returns True if written.
+
+    Setup is usually re-run with the same servers; the size check avoids
+    reading the old file when the new content obviously differs.
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+# Tool summaries for the LLM
+_CURSOR_TOOL_DESCRIPTIONS = (
+    "- `search_code`: Hybrid (Keyword + Semantic) search for finding logic and intent.",
+    "- `search_similar`: Find similar code patterns or duplicate logic.",
+    "- `analyze_project`: Get a high-level health and complexity overview.",
+    "- `find_smells`: Detect technical debt and anti-patterns.",
+    "- `analyze_impact`: Trace ripple effects before refactoring symbols.",
+    "- `get_relationships`: See callers/callees and semantic siblings of a symbol.",
+    "- `goto_definition/find_references`: High-precision navigation via LSP.",
+)
+_CURSOR_TOOL_LIST = "\n".join(_CURSOR_TOOL_DESCRIPTIONS)
+
+# .cursorrules does not depend on the configured servers, so it is built once
+_CURSOR_RULES = f"""# MCP Code Intelligence Rules
+You are an AI assistant equipped with powerful MCP tools to explore, analyze, and refactor this codebase.
+
+## 🛠 Available Tools
+These tools are provided by the `mcp-code-intelligence` server:
+{_CURSOR_TOOL_LIST}
+
+## 💡 Best Practices
+1. **Search Before You Leap**: Use `search_code` to understand existing patterns before implementing new features.
+2. **Refactor Safely**: Always run `analyze_impact` before changing a widely used function or class.
+3. **Avoid Duplication**: Use `search_similar` or `propose_logic` if you suspect the logic might already exist.
+4. **Health Check**: Periodically run `find_smells` to keep the code clean.
+5. **Precision Navigation**: Prefer `goto_definition` and `find_references` for navigating symbols as they are backed by real Language Servers (LSPs).
+
+## 🚀 How to Use
+Simply ask for what you need:
+- "Search for how authentication is handled."
+- "What is the impact of changing the 'User' class?"
+- "Find any code smells in the 'core' directory."
+
+## 🔗 Universal Reference
+See [.mcp-rules.md](.mcp-rules.md) for core protocol definitions.
+"""
+
+
+# copilot-instructions.md; only the tool list and connection snippet vary
+_COPILOT_TEMPLATE = string.Template("""# GitHub Copilot Instructions for MCP Code Intelligence
+This project is equipped with MCP (Model Context Protocol) tools that provide deep semantic understanding and codebase intelligence.
+
+## 🛠 Available MCP Tools
+The following tools are available via the `mcp-code-intelligence` server:
+${tool_list}
+
+## 🔌 Physical Connection
+If MCP tools are not automatically recognized, ensure your client is configured with:
+```json
+${connection_info}
+```
+
+## 💡 Guidelines
+- When I ask about the codebase, prioritize using `search_code` for semantic discovery.
+- Before refactoring or changing symbols, use `analyze_impact` to understand the ripple effects.
+- If you need to find similar logic, use `search_similar`.
+- Use `find_smells` to identify technical debt.
+- All tools can be invoked via the standard MCP interface.
+
+## 🔗 References
+Detailed rules are maintained in [.mcp-rules.md](../../.mcp-rules.md).
+""")
+
 
 class MCPConfigManager:
     """Manages MCP server registration and tool injection."""
@@ -10,6 +95,14 @@ class MCPConfigManager:
     def __init__(self, project_root: Path, console: Console):
         self.project_root = project_root
         self.console = console
+        # Directories already created by this manager
+        self._ensured_dirs: set[Path] = set()
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create ``directory`` (and parents) once per manager."""
+        if directory not in self._ensured_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(directory)
 
     def write_local_config(self, mcp_servers: dict, language_lsps: dict | None = None) -> Path:
         """Create or update local .mcp/mcp.json.
@@ -18,32 +111,79 @@ class MCPConfigManager:
         other components can discover available external LSP binaries.
         """
         local_mcp_path = self.project_root / ".mcp" / "mcp.json"
-        local_mcp_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(local_mcp_path.parent)
         out = {"mcpServers": mcp_servers}
         if language_lsps:
             out["languageLsps"] = language_lsps
-        with open(local_mcp_path, 'w', encoding='utf-8') as f:
-            json.dump(out, f, indent=2)
+        atomic_write_json(local_mcp_path, out)
         return local_mcp_path
 
-    def inject_global_config(self, platforms, mcp_servers: dict):
-        """Inject server configurations into detected AI tools."""
+    def _inject_one(self, platform_info, mcp_servers: dict) -> bool:
+        """Merge the servers into one platform's config file.
+
+        Returns False if the platform has no config file to update.
+        """
+        if not platform_info.config_path or not platform_info.config_path.exists():
+            return False
+
+        config = orjson.loads(platform_info.config_path.read_bytes())
+
+        servers = config.setdefault("mcpServers", {})
+        if all(servers.get(name) == entry for name, entry in mcp_servers.items()):
+            # Rewriting an identical file would still make the client reload it
+            logger.debug(f"{platform_info.platform.value} MCP config unchanged, skipping write")
+            return True
+        servers.update(mcp_servers)
+
+        atomic_write_json(platform_info.config_path, config)
+        return True
+
+    def _inject_group(self, platforms: list, mcp_servers: dict) -> list:
+        """Update platforms sharing one config file, one after another.
+
+        Each read-modify-write must see the previous one's result, or
+        entries written by an earlier platform would be lost. Returns one
+        result (or the raised exception) per platform.
+        """
+        results = []
         for platform_info in platforms:
             try:
-                if not platform_info.config_path or not platform_info.config_path.exists():
-                    continue
-
-                with open(platform_info.config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                results.append(self._inject_one(platform_info, mcp_servers))
+            except Exception as e:
+                results.append(e)
+        return results
 
-                config.setdefault("mcpServers", {}).update(mcp_servers)
+    async def inject_global_config(self, platforms, mcp_servers: dict):
+        """Inject server configurations into detected AI tools.
 
-                with open(platform_info.config_path, 'w', encoding='utf-8') as f:
-                    json.dump(config, f, indent=2)
+        Platforms are grouped by config file: distinct files are updated
+        concurrently, platforms sharing a file sequentially. Results are
+        printed afterwards in platform order.
+        """
+        platforms = list(platforms)
+        groups: dict[Path | None, list] = {}
+        for platform_info in platforms:
+            path = platform_info.config_path
+            key = Path(os.path.realpath(path)) if path else None
+            groups.setdefault(key, []).append(platform_info)
 
+        group_results = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._inject_group, group, mcp_servers)
+                for group in groups.values()
+            )
+        )
+        results = {
+            id(platform_info): result
+            for group, outcomes in zip(groups.values(), group_results, strict=True)
+            for platform_info, result in zip(group, outcomes, strict=True)
+        }
+        for platform_info in platforms:
+            result = results[id(platform_info)]
+            if isinstance(result, Exception):
+                self.console.print(f"   ⚠️  Failed to configure {platform_info.platform.value}: {result}")
+            elif result:
                 self.console.print(f"   ✅ Configured {platform_info.platform.value}")
-            except Exception as e:
-                self.console.print(f"   ⚠️  Failed to configure {platform_info.platform.value}: {e}")
 
     def setup_git_hooks(self) -> bool:
         """Install git hooks for auto-indexing."""
@@ -55,14 +195,13 @@ class MCPConfigManager:
     def inject_vscode_settings(self, mcp_servers: dict):
         """Inject MCP server configurations into .vscode/settings.json."""
         vscode_dir = self.project_root / ".vscode"
-        vscode_dir.mkdir(exist_ok=True)
+        self._ensure_dir(vscode_dir)
         settings_path = vscode_dir / "settings.json"
 
         settings = {}
         if settings_path.exists():
             try:
-                with open(settings_path, "r", encoding="utf-8") as f:
-                    settings = json.load(f)
+                settings = orjson.loads(settings_path.read_bytes())
             except Exception as e:
                 # Assuming 'logger' is defined elsewhere or should be 'self.console.print'
                 # For now, keeping it as is, but noting the potential undefined 'logger'
@@ -84,8 +223,7 @@ class MCPConfigManager:
         settings["github.copilot.chat.mcpServers"] = copilot_mcp
 
         try:
-            with open(settings_path, "w", encoding="utf-8") as f:
-                json.dump(settings, f, indent=2)
+            atomic_write_json(settings_path, settings)
             self.console.print("   ✅ Configured .vscode/settings.json (mcpServers + github.copilot)")
         except Exception as e:
             self.console.print(f"   ⚠️  Failed to configure .vscode/settings.json: {e}")
@@ -93,52 +231,35 @@ class MCPConfigManager:
     def inject_copilot_instructions(self, mcp_servers: dict):
         """Generate .github/copilot-instructions.md for GitHub Copilot."""
         copilot_dir = self.project_root / ".github"
-        copilot_dir.mkdir(exist_ok=True)
+        self._ensure_dir(copilot_dir)
         instructions_path = copilot_dir / "copilot-instructions.md"
 
-        tool_list = "\n".join([f"- `{name}`: {info.get('description', '')}" for name, info in mcp_servers.items()])
-        connection_info = json.dumps({"mcpServers": mcp_servers}, indent=2)
-        
-        content = f"""# GitHub Copilot Instructions for MCP Code Intelligence
-This project is equipped with MCP (Model Context Protocol) tools that provide deep semantic understanding and codebase intelligence.
-
-## 🛠 Available MCP Tools
-The following tools are available via the `mcp-code-intelligence` server:
-{tool_list}
-
-## 🔌 Physical Connection
-If MCP tools are not automatically recognized, ensure your client is configured with:
-```json
-{connection_info}
-```
-
-## 💡 Guidelines
-- When I ask about the codebase, prioritize using `search_code` for semantic discovery.
-- Before refactoring or changing symbols, use `analyze_impact` to understand the ripple effects.
-- If you need to find similar logic, use `search_similar`.
-- Use `find_smells` to identify technical debt.
-- All tools can be invoked via the standard MCP interface.
-
-## 🔗 References
-Detailed rules are maintained in [.mcp-rules.md](../../.mcp-rules.md).
-"""
+        tool_list = "\n".join(f"- `{name}`: {info.get('description', '')}" for name, info in mcp_servers.items())
+        connection_info = orjson.dumps(
+            {"mcpServers": mcp_servers}, option=orjson.OPT_INDENT_2
+        ).decode("utf-8")
+        content = _COPILOT_TEMPLATE.substitute(
+            tool_list=tool_list, connection_info=connection_info
+        )
         try:
-            with open(instructions_path, "w", encoding="utf-8") as f:
-                f.write(content)
-            self.console.print("   ✅ Created Copilot Instructions (.github/copilot-instructions.md)")
+            if _write_text_if_changed(instructions_path, content):
+                self.console.print("   ✅ Created Copilot Instructions (.github/copilot-instructions.md)")
+            else:
+                self.console.print("   ✅ Copilot Instructions already up to date")
         except Exception as e:
             self.console.print(f"   ⚠️  Failed to create Copilot instructions: {e}")
 
     def inject_universal_rules(self, mcp_servers: dict):
         """Generate a universal .mcp-rules.md file in the project root."""
         rules_path = self.project_root / ".mcp-rules.md"
-        
+        server_list = "\n".join(f"- **{name}**" for name in mcp_servers)
+
         content = f"""# 🧠 MCP Code Intelligence: Universal Rules
 This file defines the interaction protocols for all AI assistants (Gemini, Claude, Cursor, Copilot) in this project.
 
 ## 🛠 Active MCP Servers
 This project uses the following MCP servers for deep code analysis:
-{chr(10).join([f"- **{name}**" for name in mcp_servers.keys()])}
+{server_list}
 
 ## 📜 Core Instructions
 1. **Semantic Awareness**: Do not rely solely on filename matching. Always use `search_code` for intent-based discovery.
@@ -153,9 +274,10 @@ Individual assistants may use specific files which reference these rules:
 - **VS Code**: [`.vscode/settings.json`](.vscode/settings.json)
 """
         try:
-            with open(rules_path, "w", encoding="utf-8") as f:
-                f.write(content)
-            self.console.print("   ✅ Created Universal Rules (.mcp-rules.md)")
+            if _write_text_if_changed(rules_path, content):
+                self.console.print("   ✅ Created Universal Rules (.mcp-rules.md)")
+            else:
+                self.console.print("   ✅ Universal Rules already up to date")
         except Exception as e:
             self.console.print(f"   ⚠️  Failed to create universal rules: {e}")
 
@@ -163,43 +285,11 @@ Individual assistants may use specific files which reference these rules:
         """Generate .cursorrules file with tool definitions and instructions."""
         rules_path = self.project_root / ".cursorrules"
         
-        # Tool summaries for the LLM
-        tool_descriptions = [
-            "- `search_code`: Hybrid (Keyword + Semantic) search for finding logic and intent.",
-            "- `search_similar`: Find similar code patterns or duplicate logic.",
-            "- `analyze_project`: Get a high-level health and complexity overview.",
-            "- `find_smells`: Detect technical debt and anti-patterns.",
-            "- `analyze_impact`: Trace ripple effects before refactoring symbols.",
-            "- `get_relationships`: See callers/callees and semantic siblings of a symbol.",
-            "- `goto_definition/find_references`: High-precision navigation via LSP."
-        ]
-
-        rules_content = f"""# MCP Code Intelligence Rules
-You are an AI assistant equipped with powerful MCP tools to explore, analyze, and refactor this codebase.
-
-## 🛠 Available Tools
-These tools are provided by the `mcp-code-intelligence` server:
-{chr(10).join(tool_descriptions)}
-
-## 💡 Best Practices
-1. **Search Before You Leap**: Use `search_code` to understand existing patterns before implementing new features.
-2. **Refactor Safely**: Always run `analyze_impact` before changing a widely used function or class.
-3. **Avoid Duplication**: Use `search_similar` or `propose_logic` if you suspect the logic might already exist.
-4. **Health Check**: Periodically run `find_smells` to keep the code clean.
-5. **Precision Navigation**: Prefer `goto_definition` and `find_references` for navigating symbols as they are backed by real Language Servers (LSPs).
-
-## 🚀 How to Use
-Simply ask for what you need:
-- "Search for how authentication is handled."
-- "What is the impact of changing the 'User' class?"
-- "Find any code smells in the 'core' directory."
-
-## 🔗 Universal Reference
-See [.mcp-rules.md](.mcp-rules.md) for core protocol definitions.
-"""
+        rules_content = _CURSOR_RULES
         try:
-            with open(rules_path, "w", encoding="utf-8") as f:
-                f.write(rules_content)
-            self.console.print("   ✅ Created .cursorrules for AI guidance")
+            if _write_text_if_changed(rules_path, rules_content):
+                self.console.print("   ✅ Created .cursorrules for AI guidance")
+            else:
+                self.console.print("   ✅ .cursorrules already up to date")
         except Exception as e:
             self.console.print(f"   ⚠️  Failed to create .cursorrules: {e}")
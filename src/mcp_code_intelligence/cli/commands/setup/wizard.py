@@ -1,6 +1,4 @@
-import typer
 from rich.console import Console
-from rich.panel import Panel
 
 class SetupWizard:
     """Handles the user interface and interactive summary."""
@@ -28,6 +26,8 @@ class SetupWizard:
 
     def confirm_execution(self) -> bool:
         """Asks for user confirmation before proceeding."""
+        import typer
+
         return typer.confirm("\nDo you want to proceed with these actions?")
         
     def show_completion(self, next_steps: list):
@@ -5,7 +5,9 @@ D3.js visualization interface with chunked transfer for large JSON files.
 Uses orjson for 5-10x faster JSON serialization.
 """
 
+import ast
 import asyncio
+import functools
 import socket
 import webbrowser
 from collections.abc import AsyncGenerator
@@ -24,6 +26,28 @@ from mcp_code_intelligence import __version__
 console = Console()
 
 
+@functools.lru_cache(maxsize=8192)
+def _extract_calls(code: str) -> frozenset[str]:
+    """Extract called function/method names from a Python code snippet.
+
+    Memoized on the snippet text: caller lookups re-scan every chunk in the
+    graph on each request, so repeated requests reuse the parsed results
+    instead of calling ast.parse on the same code again.
+    """
+    calls = set()
+    try:
+        tree = ast.parse(code)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call):
+                if isinstance(node.func, ast.Name):
+                    calls.add(node.func.id)
+                elif isinstance(node.func, ast.Attribute):
+                    calls.add(node.func.attr)
+    except SyntaxError:
+        pass
+    return frozenset(calls)
+
+
 def find_free_port(start_port: int = 8501, end_port: int = 8599) -> int:
     """Find a free port in the given range.
 
@@ -176,8 +200,6 @@ def create_app(viz_dir: Path) -> FastAPI:
             )
 
         try:
-            import ast
-
             with open(graph_file, "rb") as f:
                 data = orjson.loads(f.read())
 
@@ -204,20 +226,6 @@ def create_app(viz_dir: Path) -> FastAPI:
             # Compute callers (who calls this function)
             callers = []
 
-            def extract_calls(code: str) -> set[str]:
-                calls = set()
-                try:
-                    tree = ast.parse(code)
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Call):
-                            if isinstance(node.func, ast.Name):
-                                calls.add(node.func.id)
-                            elif isinstance(node.func, ast.Attribute):
-                                calls.add(node.func.attr)
-                except SyntaxError:
-                    pass
-                return calls
-
             if function_name:
                 for node in data.get("nodes", []):
                     if node.get("type") != "chunk":
@@ -226,7 +234,7 @@ def create_app(viz_dir: Path) -> FastAPI:
                     if node_file == target_file:
                         continue
                     content = node.get("content", "")
-                    if function_name in extract_calls(content):
+                    if function_name in _extract_calls(content):
                         caller_name = node.get("function_name") or node.get(
                             "class_name"
                         )
@@ -317,8 +325,6 @@ def create_app(viz_dir: Path) -> FastAPI:
             )
 
         try:
-            import ast
-
             with open(graph_file, "rb") as f:
                 data = orjson.loads(f.read())
 
@@ -351,21 +357,6 @@ def create_app(viz_dir: Path) -> FastAPI:
             # Find callers by scanning other chunks
             callers = []
 
-            def extract_calls(code: str) -> set[str]:
-                """Extract function calls from code using AST."""
-                calls = set()
-                try:
-                    tree = ast.parse(code)
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Call):
-                            if isinstance(node.func, ast.Name):
-                                calls.add(node.func.id)
-                            elif isinstance(node.func, ast.Attribute):
-                                calls.add(node.func.attr)
-                except SyntaxError:
-                    pass
-                return calls
-
             for node in data.get("nodes", []):
                 # Skip non-code chunks and same-file chunks
                 if node.get("type") != "chunk":
@@ -376,7 +367,7 @@ def create_app(viz_dir: Path) -> FastAPI:
 
                 # Check if this chunk calls our target function
                 content = node.get("content", "")
-                if function_name in extract_calls(content):
+                if function_name in _extract_calls(content):
                     caller_name = node.get("function_name") or node.get("class_name")
                     if caller_name == "__init__":
                         continue  # Skip noise
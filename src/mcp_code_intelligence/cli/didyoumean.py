@@ -426,8 +426,15 @@ def get_fuzzy_matches(
         List of tuples (command, similarity_ratio) sorted by similarity
     """
     matches = []
+    # SequenceMatcher caches detailed info about seq2, so the typed command is
+    # set once and each candidate is cheaply upper-bounded before ratio().
+    matcher = difflib.SequenceMatcher()
+    matcher.set_seq2(command.lower())
     for cmd in available_commands:
-        ratio = difflib.SequenceMatcher(None, command.lower(), cmd.lower()).ratio()
+        matcher.set_seq1(cmd.lower())
+        if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+            continue
+        ratio = matcher.ratio()
         if ratio >= cutoff:
             matches.append((cmd, ratio))
 
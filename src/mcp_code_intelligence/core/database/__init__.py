@@ -1,8 +1,12 @@
 """Database abstraction and ChromaDB implementation for MCP Code Intelligence."""
 
+from typing import TYPE_CHECKING
+
 from .base import VectorDatabase, EmbeddingFunction
-from .chroma import ChromaVectorDatabase
-from .pooling import PooledChromaVectorDatabase
+
+if TYPE_CHECKING:
+    from .chroma import ChromaVectorDatabase
+    from .pooling import PooledChromaVectorDatabase
 
 __all__ = [
     "VectorDatabase",
@@ -10,3 +14,17 @@ __all__ = [
     "ChromaVectorDatabase",
     "PooledChromaVectorDatabase",
 ]
+
+
+def __getattr__(name: str):
+    # The concrete backends import chromadb, which is slow to load; defer
+    # them until first use so importing the abstractions stays cheap.
+    if name == "ChromaVectorDatabase":
+        from .chroma import ChromaVectorDatabase
+
+        return ChromaVectorDatabase
+    if name == "PooledChromaVectorDatabase":
+        from .pooling import PooledChromaVectorDatabase
+
+        return PooledChromaVectorDatabase
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
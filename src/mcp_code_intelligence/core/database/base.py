@@ -1,6 +1,7 @@
 """Base interfaces and protocols for vector database operations."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
@@ -135,6 +136,22 @@ class VectorDatabase(ABC):
         """
         ...
 
+    async def iter_chunks(self, batch_size: int = 1000) -> AsyncIterator[CodeChunk]:
+        """Iterate over all chunks in the database.
+
+        Backends that support paged reads override this to fetch
+        ``batch_size`` chunks at a time instead of materializing the whole
+        collection. The default falls back to ``get_all_chunks``.
+
+        Args:
+            batch_size: Number of chunks to fetch per round trip
+
+        Yields:
+            Code chunks with metadata
+        """
+        for chunk in await self.get_all_chunks():
+            yield chunk
+
     @abstractmethod
     async def get_chunks_by_symbol(
         self, symbol_name: str, symbol_type: str | None = None
@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
@@ -284,8 +285,10 @@ class ChromaVectorDatabase(VectorDatabase, DatabaseRecoveryMixin):
                 # Use chunk ID
                 ids.append(chunk.id)
 
-            # Add to collection
-            self._collection.add(
+            # Add to collection. Embedding happens inside add(), so run it off
+            # the event loop to let the indexer parse the next batch meanwhile.
+            await asyncio.to_thread(
+                self._collection.add,
                 documents=documents,
                 metadatas=metadatas,
                 ids=ids,
@@ -839,6 +842,43 @@ class ChromaVectorDatabase(VectorDatabase, DatabaseRecoveryMixin):
             logger.error(f"Failed to get all chunks: {e}")
             raise DatabaseError(f"Failed to get all chunks: {e}") from e
 
+    async def iter_chunks(self, batch_size: int = 1000) -> AsyncIterator[CodeChunk]:
+        """Iterate over all chunks, fetching them from ChromaDB page by page.
+
+        Args:
+            batch_size: Number of chunks to fetch per page
+
+        Yields:
+            Code chunks with metadata
+        """
+        if not self._collection:
+            raise DatabaseNotInitializedError("Database not initialized")
+
+        offset = 0
+        while True:
+            try:
+                results = self._collection.get(
+                    include=["metadatas", "documents"],
+                    limit=batch_size,
+                    offset=offset,
+                )
+            except Exception as e:
+                logger.error(f"Failed to iterate chunks at offset {offset}: {e}")
+                raise DatabaseError(f"Failed to iterate chunks: {e}") from e
+
+            ids = results.get("ids") if results else None
+            if not ids:
+                return
+
+            for i in range(len(ids)):
+                yield self._metadata_to_chunk(
+                    results["metadatas"][i], results["documents"][i]
+                )
+
+            if len(ids) < batch_size:
+                return
+            offset += batch_size
+
     async def health_check(self) -> bool:
         """Check database health and integrity."""
         try:
@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
@@ -402,6 +403,35 @@ class PooledChromaVectorDatabase(ChromaVectorDatabase):
             logger.error(f"Failed to get all chunks: {e}")
             raise DatabaseError(f"Failed to get all chunks: {e}") from e
 
+    async def iter_chunks(self, batch_size: int = 1000) -> AsyncIterator[CodeChunk]:
+        # Iterate over all chunks page by page, holding a pooled connection
+        # only for the duration of each page fetch.
+        offset = 0
+        while True:
+            try:
+                async with self._pool.get_connection() as conn:
+                    results = conn.collection.get(
+                        include=["metadatas", "documents"],
+                        limit=batch_size,
+                        offset=offset,
+                    )
+            except Exception as e:
+                logger.error(f"Failed to iterate chunks at offset {offset}: {e}")
+                raise DatabaseError(f"Failed to iterate chunks: {e}") from e
+
+            ids = results.get("ids") if results else None
+            if not ids:
+                return
+
+            for i in range(len(ids)):
+                yield self._metadata_to_chunk(
+                    results["metadatas"][i], results["documents"][i]
+                )
+
+            if len(ids) < batch_size:
+                return
+            offset += batch_size
+
     def get_pool_stats(self) -> dict[str, Any]:
         # Get connection pool statistics.
         return self._pool.get_stats()
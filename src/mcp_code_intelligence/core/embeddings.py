@@ -1,9 +1,11 @@
 """Embedding generation for MCP Code Intelligence."""
 
+import functools
 import hashlib
 import json
 import multiprocessing
 import os
+import platform
 from pathlib import Path
 
 
@@ -34,6 +36,53 @@ from sentence_transformers import SentenceTransformer
 
 from .exceptions import EmbeddingError
 
+# Quantized weights shipped by sentence-transformers ONNX exports, one per
+# instruction set
+_ONNX_INT8_FILES = {
+    "arm64": "onnx/model_qint8_arm64.onnx",
+    "avx512_vnni": "onnx/model_qint8_avx512_vnni.onnx",
+    "avx512": "onnx/model_qint8_avx512.onnx",
+    "avx2": "onnx/model_qint8_avx2.onnx",
+}
+
+
+@functools.cache
+def _default_onnx_int8_file() -> str:
+    """Pick the quantized ONNX file matching this CPU's instruction set.
+
+    x86 flags are only readable from /proc/cpuinfo; elsewhere AVX2, which
+    every x86-64 CPU of the last decade has, is assumed.
+    """
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return _ONNX_INT8_FILES["arm64"]
+    try:
+        flags = set(Path("/proc/cpuinfo").read_text().split())
+    except OSError:
+        flags = set()
+    if "avx512_vnni" in flags:
+        return _ONNX_INT8_FILES["avx512_vnni"]
+    if "avx512f" in flags:
+        return _ONNX_INT8_FILES["avx512"]
+    return _ONNX_INT8_FILES["avx2"]
+
+
+def _backend_model_kwargs() -> dict:
+    """Return SentenceTransformer kwargs for the backend in MCP_EMBEDDING_BACKEND.
+
+    ``torch`` (default) keeps the stock backend. ``onnx`` runs the model's ONNX
+    export through onnxruntime, and ``onnx-int8`` additionally loads the
+    dynamically quantized INT8 weights: the file in MCP_EMBEDDING_ONNX_FILE,
+    or the one matching this CPU. Vectors differ slightly between backends,
+    so reindex after switching.
+    """
+    backend = os.getenv("MCP_EMBEDDING_BACKEND", "torch").lower()
+    if backend == "onnx":
+        return {"backend": "onnx"}
+    if backend == "onnx-int8":
+        file_name = os.getenv("MCP_EMBEDDING_ONNX_FILE") or _default_onnx_int8_file()
+        return {"backend": "onnx", "model_kwargs": {"file_name": file_name}}
+    return {}
+
 
 class EmbeddingCache:
     """LRU cache for embeddings with disk persistence."""
@@ -162,17 +211,24 @@ class CodeBERTEmbeddingFunction:
         self,
         model_name: str = "jinaai/jina-embeddings-v3",
         timeout: float = 300.0,  # 5 minutes default timeout
+        backend_kwargs: dict | None = None,
     ) -> None:
         """Initialize embedding function.
 
         Args:
             model_name: Name of the sentence transformer model
             timeout: Timeout in seconds for embedding generation (default: 300s)
+            backend_kwargs: SentenceTransformer backend kwargs; defaults to
+                the backend selected by MCP_EMBEDDING_BACKEND
         """
+        if backend_kwargs is None:
+            backend_kwargs = _backend_model_kwargs()
         try:
             # Jina and other modern models require trust_remote_code
             trust_remote = "jina" in model_name.lower() or "bge" in model_name.lower()
-            self.model = SentenceTransformer(model_name, trust_remote_code=trust_remote)
+            self.model = SentenceTransformer(
+                model_name, trust_remote_code=trust_remote, **backend_kwargs
+            )
             self.model_name = model_name
             self._name = model_name.replace("/", "_")  # Internal name storage
             self.timeout = timeout
@@ -344,15 +400,17 @@ def create_embedding_function(
         # default config which includes normalization
         embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
             model_name=actual_model,
-            trust_remote_code=trust_remote
+            trust_remote_code=trust_remote,
+            **_backend_model_kwargs(),
         )
 
         logger.debug(f"Created ChromaDB embedding function with model: {actual_model}")
 
     except Exception as e:
         logger.warning(f"Failed to create ChromaDB embedding function: {e}")
-        # Fallback to our custom implementation
-        embedding_function = CodeBERTEmbeddingFunction(model_name)
+        # Fallback to our custom implementation on the stock backend, in case
+        # the configured ONNX backend is what failed
+        embedding_function = CodeBERTEmbeddingFunction(model_name, backend_kwargs={})
 
     cache = None
     if cache_dir:
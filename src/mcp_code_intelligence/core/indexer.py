@@ -3,6 +3,7 @@
 import asyncio
 import os
 import json
+from dataclasses import fields
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -28,6 +29,9 @@ from .services.metrics import MetricsService
 # Allowed dotfiles that should not be ignored by the indexer
 ALLOWED_DOTFILES = {'.env', '.gitignore', '.gitattributes', '.dockerignore', '.editorconfig', '.prettierrc', '.eslintrc', '.pylintrc', '.flake8', '.coveragerc', '.pre-commit-config.yaml', '.pre-commit-hooks.yaml', '.mcp-code-intelligence'}
 
+# CodeChunk field names, resolved once for building shallow BM25 documents
+_CODE_CHUNK_FIELDS = tuple(f.name for f in fields(CodeChunk))
+
 # Extension to language mapping for metric collection
 EXTENSION_TO_LANGUAGE = {
     ".py": "python",
@@ -282,11 +286,19 @@ class SemanticIndexer:
         self, file_paths: list[Path], force_reindex: bool = False
     ) -> list[tuple[bool, int]]:
         """Process a batch of files and accumulate chunks for batch embedding."""
+        metadata = self._load_index_metadata()
+        prepared = await self._prepare_file_batch(file_paths)
+        return await self._store_file_batch(file_paths, *prepared, metadata)
+
+    async def _prepare_file_batch(
+        self, file_paths: list[Path]
+    ) -> tuple[list[CodeChunk], dict[str, Any], list[tuple[bool, int]], dict[str, float]]:
+        """Parse a batch of files and collect chunks, metrics and mtimes (no embedding)."""
         all_chunks: list[CodeChunk] = []
         all_metrics: dict[str, Any] = {}
         batch_results: list[tuple[bool, int]] = []
+        mtimes: dict[str, float] = {}
 
-        metadata = self._load_index_metadata()
         for file_path in file_paths:
             if not self._should_index_file(file_path):
                 batch_results.append((True, 0))
@@ -317,15 +329,27 @@ class SemanticIndexer:
                     if chunk_metrics:
                         all_metrics.update(chunk_metrics)
 
-                    metadata[str(file_path)] = os.path.getmtime(file_path)
+                    mtimes[str(file_path)] = os.path.getmtime(file_path)
                     batch_results.append((True, chunk_count))
                 else:
-                    metadata[str(file_path)] = os.path.getmtime(file_path)
+                    mtimes[str(file_path)] = os.path.getmtime(file_path)
                     batch_results.append((True, 0))
             except Exception as e:
                 logger.error(f"Failed to parse {file_path}: {e}")
                 batch_results.append((False, 0))
 
+        return all_chunks, all_metrics, batch_results, mtimes
+
+    async def _store_file_batch(
+        self,
+        file_paths: list[Path],
+        all_chunks: list[CodeChunk],
+        all_metrics: dict[str, Any],
+        batch_results: list[tuple[bool, int]],
+        mtimes: dict[str, float],
+        metadata: dict[str, Any],
+    ) -> list[tuple[bool, int]]:
+        """Embed and insert a prepared batch, then persist its file mtimes."""
         # Single database insertion for entire batch
         if all_chunks:
             logger.info(f"Batch inserting {len(all_chunks)} chunks from {len(file_paths)} files")
@@ -336,6 +360,7 @@ class SemanticIndexer:
                 logger.error(f"Failed to insert batch of chunks: {e}")
                 return [(False, 0)] * len(file_paths)
 
+        metadata.update(mtimes)
         self._save_index_metadata(metadata)
         return batch_results
 
@@ -486,9 +511,12 @@ class SemanticIndexer:
 
             chunks_with_hierarchy = self._build_chunk_hierarchy(chunks)
 
-            # Add to BM25 index
+            # Add to BM25 index. A shallow field mapping: asdict() would
+            # deep-copy every list/dict field of every chunk.
             for chunk in chunks_with_hierarchy:
-                self.bm25_index.add_chunk(chunk.__dict__)
+                self.bm25_index.add_chunk(
+                    {name: getattr(chunk, name) for name in _CODE_CHUNK_FIELDS}
+                )
 
             # Collect metrics for chunks using MetricsService
             chunk_metrics: dict[str, Any] | None = None
@@ -766,17 +794,14 @@ class SemanticIndexer:
                 await self.database.add_chunks(chunks, metrics=metrics)
                 return
 
-            start = 0
-            while start < len(chunks):
-                end = start + batch_size
-                sub_chunks = chunks[start:end]
+            for start in range(0, len(chunks), batch_size):
+                sub_chunks = chunks[start : start + batch_size]
 
                 sub_metrics = None
                 if metrics:
-                    sub_metrics = {k: v for k, v in metrics.items() if any(c.chunk_id == k for c in sub_chunks)}
+                    sub_metrics = {c.chunk_id: metrics[c.chunk_id] for c in sub_chunks if c.chunk_id in metrics}
 
                 await self.database.add_chunks(sub_chunks, metrics=sub_metrics)
-                start = end
 
         finally:
             self._restore_onnx_thread_limits(prev_env)
@@ -784,20 +809,44 @@ class SemanticIndexer:
     async def index_files_with_progress(
         self, file_paths: list[Path], force_reindex: bool = False
     ):
-        """Async generator that indexes files and yields progress for each file."""
-        for i in range(0, len(file_paths), self.batch_size):
-            batch = file_paths[i : i + self.batch_size]
+        """Async generator that indexes files and yields progress for each file.
 
-            # Process batch in parallel
-            batch_results = await self._process_file_batch(batch, force_reindex)
+        Parsing and embedding are pipelined one batch deep: while batch N is
+        being embedded and inserted, batch N+1 is already being parsed. The
+        metadata dict is loaded once and only written by the store stage, so
+        the two stages never race on index_metadata.json.
+        """
+        metadata = self._load_index_metadata()
+        pending: tuple[list[Path], asyncio.Task] | None = None
+
+        try:
+            for i in range(0, len(file_paths), self.batch_size):
+                batch = file_paths[i : i + self.batch_size]
+                prepared = await self._prepare_file_batch(batch)
+
+                if pending is not None:
+                    prev_batch, prev_task = pending
+                    pending = None
+                    for file_path, (success, chunks_added) in zip(prev_batch, await prev_task, strict=True):
+                        yield (file_path, chunks_added, success)
+
+                pending = (
+                    batch,
+                    asyncio.create_task(self._store_file_batch(batch, *prepared, metadata)),
+                )
 
-            # Yield results for each file in the batch
-            for file_path, (success, chunks_added) in zip(batch, batch_results):
-                yield (file_path, chunks_added, success)
+                # Throttling to reduce system load
+                if self.throttle_delay > 0 and i + self.batch_size < len(file_paths):
+                    await asyncio.sleep(self.throttle_delay)
 
-            # Throttling to reduce system load
-            if self.throttle_delay > 0 and i + self.batch_size < len(file_paths):
-                await asyncio.sleep(self.throttle_delay)
+            if pending is not None:
+                prev_batch, prev_task = pending
+                pending = None
+                for file_path, (success, chunks_added) in zip(prev_batch, await prev_task, strict=True):
+                    yield (file_path, chunks_added, success)
+        finally:
+            if pending is not None:
+                pending[1].cancel()
 
     def get_index_version(self) -> str:
         """Get the current index version."""
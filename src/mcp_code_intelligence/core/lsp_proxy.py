@@ -209,7 +209,7 @@ class LSPManager:
         if not cfg_path.exists():
             return {}
         try:
-            data = json.loads(cfg_path.read_text(encoding="utf-8"))
+            data = json.loads(cfg_path.read_bytes())
             return data.get("languageLsps", {}) or {}
         except Exception:
             return {}
@@ -7,9 +7,14 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeChunk:
-    """Represents a chunk of code with metadata."""
+    """Represents a chunk of code with metadata.
+
+    Uses ``__slots__`` since indexing and analysis hold many chunks in memory
+    at once; fields are still mutable (hierarchy building links chunks after
+    construction), so the dataclass is not frozen.
+    """
 
     content: str
     file_path: Path
@@ -1,6 +1,7 @@
 """Project detection and management for MCP Code Intelligence."""
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
 
 from loguru import logger
@@ -21,6 +22,9 @@ from .exceptions import (
 )
 from .models import ProjectInfo
 
+# DEFAULT_IGNORE_PATTERNS as a set for O(1) name checks. Names are compared
+# exactly, as the list was; glob entries such as ".*" only match themselves.
+_IGNORE_NAMES = frozenset(DEFAULT_IGNORE_PATTERNS)
 
 class ProjectManager:
     """Manages project detection, initialization, and configuration."""
@@ -310,30 +314,48 @@ class ProjectManager:
             file_count=computed_file_count,
         )
 
-    def _iter_source_files(self) -> list[Path]:
+    def _iter_source_files(self) -> Iterator[Path]:
         """Iterate over source files in the project.
 
-        Returns:
-            List of source file paths
+        Files are yielded as the walk reaches them, so callers that stop
+        early don't pay for walking the rest of the tree.
+
+        Yields:
+            Source file paths
         """
         import os
-        files = []
 
         for root, dirs, filenames in os.walk(self.project_root, topdown=True):
             # Optimization: Filter directories IN-PLACE to skip ignored ones
-            dirs[:] = [
-                d for d in dirs
-                if not self._should_ignore_path(Path(root) / d, is_directory=True)
-            ]
+            dirs[:] = [d for d in dirs if not self._should_ignore_dir(root, d)]
 
             for filename in filenames:
                 path = Path(root) / filename
                 # Files are already filtered by directory pruning, 
                 # but we check the file itself just in case of file-specific ignore patterns
                 if not self._should_ignore_path(path, is_directory=False):
-                    files.append(path)
+                    yield path
+
+    def _should_ignore_dir(self, parent: str, name: str) -> bool:
+        """Check if a directory met during a top-down walk should be pruned.
+
+        The walk has already pruned every ancestor, so only the directory's
+        own name needs matching against the default patterns; a Path is built
+        only when gitignore rules have to be consulted.
+
+        Args:
+            parent: Directory being walked (as yielded by os.walk)
+            name: Name of the subdirectory
 
-        return files
+        Returns:
+            True if the subdirectory should not be descended into
+        """
+        if name in _IGNORE_NAMES:
+            return True
+        return bool(
+            self.gitignore_parser
+            and self.gitignore_parser.is_ignored(Path(parent, name), is_directory=True)
+        )
 
     def _should_ignore_path(self, path: Path, is_directory: bool | None = None) -> bool:
         """Check if a path should be ignored.
@@ -354,14 +376,14 @@ class ProjectManager:
 
         # Check if any parent directory is in ignore patterns
         for part in path.parts:
-            if part in DEFAULT_IGNORE_PATTERNS:
+            if part in _IGNORE_NAMES:
                 return True
 
         # Check relative path from project root
         try:
             relative_path = path.relative_to(self.project_root)
             for part in relative_path.parts:
-                if part in DEFAULT_IGNORE_PATTERNS:
+                if part in _IGNORE_NAMES:
                     return True
         except ValueError:
             # Path is not relative to project root
@@ -31,6 +31,13 @@ from .models import CodeChunk
 
 console = Console()
 
+# Regex fallback for non-Python (or unparseable) code: an identifier followed by
+# an opening parenthesis is a call. Compiled once since it runs for every chunk.
+_CALL_PATTERN = re.compile(r"\b([a-zA-Z_]\w*)\s*(?=\()")
+_CALL_KEYWORDS = frozenset(
+    {"if", "for", "while", "switch", "catch", "return", "yield", "await", "async"}
+)
+
 
 def extract_function_calls(code: str, language: str = "python") -> set[str]:
     """Extract actual function calls from code.
@@ -55,17 +62,8 @@ def extract_function_calls(code: str, language: str = "python") -> set[str]:
 
     # 2. Universal Regex fallback (handles Dart, JS, etc.)
     # Matches patterns like funcName(), obj.methodName(), but avoids keywords
-    # Excludes common control flow keywords
-    keywords = {'if', 'for', 'while', 'switch', 'catch', 'return', 'yield', 'await', 'async'}
-
-    # Pattern explanation:
-    # [a-zA-Z_]\w* : Identifier
-    # (?=\s*\()    : Lookahead for opening parenthesis (means it's a call)
-    matches = re.findall(r'\b([a-zA-Z_]\w*)\s*(?=\()', code)
-
-    for match in matches:
-        if match not in keywords:
-            calls.add(match)
+    calls.update(_CALL_PATTERN.findall(code))
+    calls.difference_update(_CALL_KEYWORDS)
 
     return calls
 
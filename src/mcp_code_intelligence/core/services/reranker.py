@@ -7,6 +7,11 @@ not available, falls back to a no-op re-ranker.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import importlib.util
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional, List
 
 from ..interfaces import RerankerService
@@ -16,16 +21,59 @@ from loguru import logger
 
 
 def _check_transformers():
-    try:
-        import transformers
-        import torch
-        return True
-    except ImportError:
-        return False
+    # find_spec only locates the packages; importing torch/transformers here
+    # would add seconds to every process that imports the search engine.
+    # Broken installs still surface as ImportError on first model load.
+    return all(importlib.util.find_spec(name) is not None for name in ("transformers", "torch"))
 
 HAS_TRANSFORMERS = _check_transformers()
 
 
+class _ScoreCache:
+    """Thread-safe LRU of cross-encoder scores with a time-to-live.
+
+    Keys are 16-byte BLAKE2b digests of (query, candidate text), so repeated
+    queries over unchanged code skip model inference entirely.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 900.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[bytes, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(query: str, text: str) -> bytes:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(query.encode("utf-8"))
+        h.update(b"\0")
+        h.update(text.encode("utf-8"))
+        return h.digest()
+
+    def get(self, key: bytes) -> Optional[float]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            score, expires = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return score
+
+    def put(self, key: bytes, score: float) -> None:
+        with self._lock:
+            self._data[key] = (score, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
 class LazyHFReRanker(RerankerService):
     """HF-based reranker that lazy-loads model/tokenizer on first use.
 
@@ -39,6 +87,7 @@ class LazyHFReRanker(RerankerService):
         self._model = None
         self._tokenizer = None
         self._device_str = None  # Track device string for logging
+        self._score_cache = _ScoreCache()
 
     def _ensure_loaded(self) -> None:
         if not HAS_TRANSFORMERS or not self.model_name:
@@ -67,8 +116,6 @@ class LazyHFReRanker(RerankerService):
         if not HAS_TRANSFORMERS or not self.model_name:
             return results
 
-        import time
-
         def _top3_log(res, label):
             msg = f"[Reranker] {label} ilk 3: "
             for i, r in enumerate(res[:3]):
@@ -85,11 +132,19 @@ class LazyHFReRanker(RerankerService):
                 if self._model is None or self._tokenizer is None:
                     return results
 
-                # Prepare pairwise inputs: [query || candidate_text]
-                inputs = []
-                for r in results:
-                    preview = getattr(r, "preview_text", None) or getattr(r, "text", None) or str(getattr(r, "file_path", ""))
-                    inputs.append(f"{query} </s> {preview}")
+                previews = [
+                    getattr(r, "preview_text", None) or getattr(r, "text", None) or str(getattr(r, "file_path", ""))
+                    for r in results
+                ]
+                keys = [self._score_cache.key(query, p) for p in previews]
+                scores = [self._score_cache.get(k) for k in keys]
+                missing = [i for i, sc in enumerate(scores) if sc is None]
+                if not missing:
+                    logger.debug(f"[JinaLocal] All {len(results)} rerank scores served from cache")
+                    return self._sort_by_scores(results, scores)
+
+                # Prepare pairwise inputs for uncached candidates: [query || candidate_text]
+                inputs = [f"{query} </s> {previews[i]}" for i in missing]
 
                 import torch as _torch
                 import torch.nn.functional as F
@@ -104,12 +159,18 @@ class LazyHFReRanker(RerankerService):
                 with _torch.no_grad():
                     logits = self._model(**enc).logits
                     probs = F.softmax(logits, dim=-1)
-                    scores = probs[:, -1].cpu().numpy()
+                    new_scores = probs[:, -1].cpu().numpy()
                 duration = time.time() - start_time
 
+                for i, score in zip(missing, new_scores.tolist(), strict=True):
+                    scores[i] = score
+                    self._score_cache.put(keys[i], score)
+
                 # Log tensor shape and inference time
                 logger.debug(f"[JinaLocal] Model output logits shape: {getattr(logits, 'shape', '?')}")
-                logger.info(f"⚡ Jina Local Inference: {duration:.3f}s | Device: {self._device_str or device}")
+                logger.info(
+                    f"⚡ Jina Local Inference: {duration:.3f}s ({len(missing)}/{len(results)} uncached) | Device: {self._device_str or device}"
+                )
 
                 # Log memory usage (RAM/VRAM)
                 try:
@@ -127,10 +188,7 @@ class LazyHFReRanker(RerankerService):
                 except Exception:
                     pass
 
-                scored = list(zip(scores.tolist(), results))
-                scored.sort(key=lambda x: x[0], reverse=True)
-                reranked = [r for _, r in scored]
-                return reranked
+                return self._sort_by_scores(results, scores)
             except ImportError as e:
                 logger.warning(f"Opsiyonel ML bağımlılığı eksik: {e}")
                 return results
@@ -142,6 +200,12 @@ class LazyHFReRanker(RerankerService):
         _top3_log(ranked, "Sonra")
         return ranked
 
+    @staticmethod
+    def _sort_by_scores(results: List[SearchResult], scores: List[float]) -> List[SearchResult]:
+        scored = list(zip(scores, results, strict=True))
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return [r for _, r in scored]
+
 
 _GLOBAL_RERANKER: Optional[LazyHFReRanker] = None
 
@@ -3,11 +3,14 @@
 Provides a single source of truth for tool descriptions, schemas and LLM
 function specs so `get_tools()` and the chat agent share the same data.
 """
+from collections.abc import Mapping
 from typing import Any, Dict, List
 from mcp.types import Tool
 from pathlib import Path
+from types import MappingProxyType
 import json
 from typing import Optional
+import functools
 import importlib
 import re
 import time
@@ -284,6 +287,46 @@ def get_tool_definitions() -> List[Dict[str, Any]]:
     return defs
 
 
+# Parsed .mcp/mcp.json per config path, keyed by its mtime so edits are picked up
+_PROJECT_CONFIG_CACHE: Dict[Path, tuple[int, Mapping[str, Any]]] = {}
+
+
+def _load_project_config(project_root: Path) -> Mapping[str, Any]:
+    """Return the parsed `.mcp/mcp.json` for a project ({} if it does not exist).
+
+    The parse is reused until the file's mtime changes, and is shared with
+    external `get_advertised_tools` hooks, so it is returned read-only.
+    Malformed JSON raises so callers can surface it.
+    """
+    cfg_path = Path(project_root) / ".mcp" / "mcp.json"
+    try:
+        mtime = cfg_path.stat().st_mtime_ns
+    except OSError:
+        _PROJECT_CONFIG_CACHE.pop(cfg_path, None)
+        return {}
+
+    cached = _PROJECT_CONFIG_CACHE.get(cfg_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    cfg = MappingProxyType(json.loads(cfg_path.read_text(encoding="utf-8")))
+    _PROJECT_CONFIG_CACHE[cfg_path] = (mtime, cfg)
+    return cfg
+
+
+@functools.cache
+def _language_friendly_name(lang_key: str) -> str:
+    """Return the display name from languages/<lang_key>.json, or the key itself."""
+    lang_file = Path(__file__).parent.parent / "languages" / f"{lang_key}.json"
+    try:
+        if lang_file.exists():
+            data = json.loads(lang_file.read_text(encoding="utf-8"))
+            return data.get("name", lang_key)
+    except Exception:
+        pass
+    return lang_key
+
+
 def get_mcp_tools(project_root: Optional[Path] = None, servers_tools: Optional[dict] = None) -> List[Tool]:
     """Return a list of `Tool` objects for MCP `get_tools()` consumption.
 
@@ -292,13 +335,11 @@ def get_mcp_tools(project_root: Optional[Path] = None, servers_tools: Optional[d
     that only relevant language tools are advertised to the AI.
     """
     tools: List[Tool] = []
-    project_cfg = {}
+    project_cfg: Mapping[str, Any] = {}
 
     if project_root:
         try:
-            cfg_path = Path(project_root) / ".mcp" / "mcp.json"
-            if cfg_path.exists():
-                project_cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
+            project_cfg = _load_project_config(project_root)
         except Exception as e:
             # Add a remediation tool so users get actionable guidance
             err_name = "fix_mcp_config_malformed"
@@ -480,11 +521,7 @@ def get_mcp_tools(project_root: Optional[Path] = None, servers_tools: Optional[d
 
     # Read local .mcp/mcp.json to discover configured language LSPs
     try:
-        cfg_path = Path(project_root) / ".mcp" / "mcp.json"
-        if not cfg_path.exists():
-            return tools
-        cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
-        lang_map = cfg.get("languageLsps", {}) or {}
+        lang_map = _load_project_config(project_root).get("languageLsps", {}) or {}
     except Exception:
         return tools
 
@@ -493,15 +530,7 @@ def get_mcp_tools(project_root: Optional[Path] = None, servers_tools: Optional[d
         # Normalize lang key
         lk = str(lang_id).lower()
         # Friendly name: try to read languages/<lang_id>.json if exists
-        langs_dir = Path(__file__).parent.parent / "languages"
-        friendly = lk
-        try:
-            lang_file = langs_dir / f"{lk}.json"
-            if lang_file.exists():
-                data = json.loads(lang_file.read_text(encoding="utf-8"))
-                friendly = data.get("name", lk)
-        except Exception:
-            pass
+        friendly = _language_friendly_name(lk)
 
         lsp_tools = [
             ("goto_definition",
@@ -595,27 +624,14 @@ def get_llm_tool_specs(project_root: Path | None = None, servers_tools: Optional
     # If project_root provided, add dynamic LSP tools for configured languages
     if project_root:
         try:
-            cfg_path = Path(project_root) / ".mcp" / "mcp.json"
-            if cfg_path.exists():
-                cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
-                lang_map = cfg.get("languageLsps", {}) or {}
-            else:
-                lang_map = {}
+            lang_map = _load_project_config(project_root).get("languageLsps", {}) or {}
         except Exception:
             lang_map = {}
 
         for lang_id in lang_map.keys():
             lk = str(lang_id).lower()
             # Friendly name lookup
-            langs_dir = Path(__file__).parent.parent / "languages"
-            friendly = lk
-            try:
-                lang_file = langs_dir / f"{lk}.json"
-                if lang_file.exists():
-                    data = json.loads(lang_file.read_text(encoding="utf-8"))
-                    friendly = data.get("name", lk)
-            except Exception:
-                pass
+            friendly = _language_friendly_name(lk)
 
             lsp_defs = [
                 ("goto_definition",
@@ -8,6 +8,11 @@ from loguru import logger
 from ..core.models import CodeChunk
 from .base import BaseParser
 
+# Regex fallback patterns, compiled once and applied to the whole file content
+_FUNCTION_PATTERN = re.compile(r"^\s*def\s+(\w+)\s*\(", re.MULTILINE)
+_CLASS_PATTERN = re.compile(r"^\s*class\s+(\w+)\s*[:\(]", re.MULTILINE)
+_IMPORT_PATTERN = re.compile(r"^\s*(from\s+\S+\s+)?import\s+(.+)", re.MULTILINE)
+
 
 class PythonParser(BaseParser):
     """Python parser using Tree-sitter for AST-based code analysis."""
@@ -413,25 +418,17 @@ class PythonParser(BaseParser):
         chunks = []
         lines = self._split_into_lines(content)
 
-        # Enhanced regex patterns
-        function_pattern = re.compile(r"^\s*def\s+(\w+)\s*\(", re.MULTILINE)
-        class_pattern = re.compile(r"^\s*class\s+(\w+)\s*[:\(]", re.MULTILINE)
-        import_pattern = re.compile(r"^\s*(from\s+\S+\s+)?import\s+(.+)", re.MULTILINE)
-
         # Extract imports first
-        imports = []
-        for match in import_pattern.finditer(content):
-            import_line = match.group(0).strip()
-            imports.append(import_line)
+        imports = [match.group(0).strip() for match in _IMPORT_PATTERN.finditer(content)]
 
         # Find functions
-        for match in function_pattern.finditer(content):
+        for match in _FUNCTION_PATTERN.finditer(content):
             function_name = match.group(1)
             # Find the actual line with 'def' by looking for it in the match
             match_text = match.group(0)
             def_pos_in_match = match_text.find("def")
             actual_def_pos = match.start() + def_pos_in_match
-            start_line = content[:actual_def_pos].count("\n") + 1
+            start_line = content.count("\n", 0, actual_def_pos) + 1
 
             # Find end of function (simple heuristic)
             end_line = self._find_function_end(lines, start_line)
@@ -455,13 +452,13 @@ class PythonParser(BaseParser):
                 chunks.append(chunk)
 
         # Find classes
-        for match in class_pattern.finditer(content):
+        for match in _CLASS_PATTERN.finditer(content):
             class_name = match.group(1)
             # Find the actual line with 'class' by looking for it in the match
             match_text = match.group(0)
             class_pos_in_match = match_text.find("class")
             actual_class_pos = match.start() + class_pos_in_match
-            start_line = content[:actual_class_pos].count("\n") + 1
+            start_line = content.count("\n", 0, actual_class_pos) + 1
 
             # Find end of class (simple heuristic)
             end_line = self._find_class_end(lines, start_line)
@@ -6,6 +6,7 @@ vector-database clients. Heavy dependencies are imported lazily inside
 try/except blocks to avoid import-time crashes when the optional packages are
 not installed.
 """
+import importlib.util
 from pathlib import Path
 from typing import List
 
@@ -21,11 +22,9 @@ except Exception:
 
 
 def _check_onnxruntime_available():
+    # Locate without importing: discovery only needs to know it is installed
     try:
-        import onnxruntime  # type: ignore
-        return True
-    except ImportError:
-        return False
+        return importlib.util.find_spec("onnxruntime") is not None
     except Exception:
         return False
 
@@ -1,5 +1,6 @@
 """Utility modules for MCP Code Intelligence."""
 
+from .atomic_write import atomic_write_json
 from .gitignore import (
     GitignoreParser,
     GitignorePattern,
@@ -20,6 +21,8 @@ from .timing import (
 from .version import get_user_agent, get_version_info, get_version_string
 
 __all__ = [
+    # File utilities
+    "atomic_write_json",
     # Gitignore utilities
     "GitignoreParser",
     "GitignorePattern",
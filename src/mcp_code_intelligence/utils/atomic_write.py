@@ -0,0 +1,56 @@
+"""Atomic JSON writes for config files that other tools read concurrently."""
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+# NamedTemporaryFile creates files as 0600; new configs get the usual mode
+# instead (existing ones keep theirs). Querying the umask would mean briefly
+# changing it for the whole process.
+_NEW_FILE_MODE = 0o644
+
+
+def atomic_write_json(path: Path, data: Any) -> bool:
+    """Write ``data`` as indented JSON, swapping the file in with a rename.
+
+    Editors and MCP clients read these configs while we write them, so a
+    crash mid-write must never leave a truncated file behind. The temp file
+    gets a unique name in the target directory, so concurrent writers never
+    share one. A file that already holds exactly these bytes is left alone,
+    so watchers don't reload it for nothing.
+
+    Args:
+        path: Destination file; its directory must exist
+        data: JSON-serializable object
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    new_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    try:
+        if path.read_bytes() == new_bytes:
+            return False
+    except OSError:
+        pass
+
+    temp_file = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    )
+    temp_path = Path(temp_file.name)
+    try:
+        with temp_file:
+            temp_file.write(new_bytes)
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except OSError:
+            mode = _NEW_FILE_MODE
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return True
@@ -161,6 +161,23 @@ class TestAnalyzeGitIntegration:
         assert file1 in files
         assert file2 in files
 
+    @pytest.mark.asyncio
+    async def test_find_analyzable_files_skips_ignored_directories(self, tmp_path):
+        """Test that ignored directories are not scanned in the fallback walk."""
+        kept = tmp_path / "src" / "module.py"
+        kept.parent.mkdir()
+        kept.write_text("def foo(): pass")
+        for ignored in ("node_modules", ".venv", "__pycache__"):
+            ignored_file = tmp_path / ignored / "nested" / "skip.py"
+            ignored_file.parent.mkdir(parents=True)
+            ignored_file.write_text("def bar(): pass")
+
+        registry = ParserRegistry()
+
+        files = _find_analyzable_files(tmp_path, None, None, registry, None)
+
+        assert files == [kept]
+
     @pytest.mark.asyncio
     async def test_find_analyzable_files_git_filter_specific_file(self, tmp_path):
         """Test git filter with path_filter pointing to specific file."""
@@ -0,0 +1,96 @@
+"""Unit tests for DiscoveryManager.scan_file_extensions."""
+
+import itertools
+import os
+from unittest.mock import patch
+
+import pytest
+
+from mcp_code_intelligence.cli.commands.setup.discovery import DiscoveryManager
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("print('hello')\n")
+    return tmp_path
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestScanCache:
+    """The scan result is cached against the project root's mtime."""
+
+    def test_second_call_reuses_cached_result(self, project):
+        discovery = DiscoveryManager(project)
+        assert discovery.scan_file_extensions() == [".py"]
+
+        # Adding a file in a subdirectory leaves the root's mtime alone
+        (project / "src" / "app.ts").write_text("export {};\n")
+
+        assert discovery.scan_file_extensions() == [".py"]
+
+    def test_touching_root_invalidates_cache(self, project):
+        discovery = DiscoveryManager(project)
+        assert discovery.scan_file_extensions() == [".py"]
+
+        (project / "src" / "app.ts").write_text("export {};\n")
+        _bump_mtime(project)
+
+        assert discovery.scan_file_extensions() == [".py", ".ts"]
+
+
+class TestScanEarlyStop:
+    """The walk stops once enough extensions have been seen."""
+
+    def test_stops_at_max_extensions_and_caches(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        (tmp_path / "web").mkdir()
+        (tmp_path / "web" / "b.ts").write_text("export {};\n")
+        discovery = DiscoveryManager(tmp_path)
+
+        with patch(
+            "mcp_code_intelligence.cli.commands.setup.discovery._MAX_SCAN_EXTENSIONS", 1
+        ), patch("mcp_code_intelligence.cli.commands.setup.discovery.logger") as log:
+            result = discovery.scan_file_extensions()
+
+        # Root files come before subdirectories in a top-down walk
+        assert result == [".py"]
+        assert discovery._ext_cache == (tmp_path.stat().st_mtime_ns, [".py"])
+        messages = [call.args[0] for call in log.debug.call_args_list]
+        assert "Extension scan saturated, stopping early" in messages
+        assert any(m.startswith("Scan complete: 1 files searched") for m in messages)
+
+
+class TestScanTimeout:
+    """A scan that runs out of time returns what it found without caching it."""
+
+    def test_partial_results_are_returned_and_not_cached(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        (tmp_path / "web").mkdir()
+        (tmp_path / "web" / "b.ts").write_text("export {};\n")
+        discovery = DiscoveryManager(tmp_path)
+
+        # Deadline computed at t=0, root directory walked at t=0, then time is up
+        clock = itertools.chain([0.0, 0.0], itertools.repeat(100.0))
+        with patch("mcp_code_intelligence.cli.commands.setup.discovery.time") as fake_time:
+            fake_time.monotonic.side_effect = lambda: next(clock)
+            result = discovery.scan_file_extensions(timeout=5.0)
+
+        assert result == [".py"]
+        assert discovery._ext_cache is None
+
+    def test_timeout_before_any_extension_returns_none(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        discovery = DiscoveryManager(tmp_path)
+
+        clock = itertools.chain([0.0], itertools.repeat(100.0))
+        with patch("mcp_code_intelligence.cli.commands.setup.discovery.time") as fake_time:
+            fake_time.monotonic.side_effect = lambda: next(clock)
+            result = discovery.scan_file_extensions(timeout=5.0)
+
+        assert result is None
+        assert discovery._ext_cache is None
@@ -0,0 +1,87 @@
+"""Unit tests for MCP config injection during setup."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_code_intelligence.cli.commands.setup.mcp_config import MCPConfigManager
+
+
+def _platform(name, config_path):
+    return SimpleNamespace(platform=SimpleNamespace(value=name), config_path=config_path)
+
+
+class TestInjectGlobalConfig:
+    """Tests for MCPConfigManager.inject_global_config."""
+
+    @pytest.mark.asyncio
+    async def test_platforms_sharing_a_config_file_keep_all_entries(self, tmp_path):
+        shared = tmp_path / "mcp.json"
+        shared.write_text(json.dumps({"mcpServers": {"existing": {"command": "keep"}}}))
+        separate = tmp_path / "other.json"
+        separate.write_text(json.dumps({"mcpServers": {}}))
+        platforms = [
+            _platform("cursor", shared),
+            _platform("cursor-alias", shared),
+            _platform("windsurf", separate),
+        ]
+        console = Mock()
+        manager = MCPConfigManager(tmp_path, console)
+        servers = {"mcp-code-intelligence": {"command": "uv", "args": ["run"]}}
+
+        await manager.inject_global_config(platforms, servers)
+
+        assert json.loads(shared.read_text())["mcpServers"] == {
+            "existing": {"command": "keep"},
+            **servers,
+        }
+        assert json.loads(separate.read_text())["mcpServers"] == servers
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["mcp.json", "other.json"]
+        printed = [call.args[0] for call in console.print.call_args_list]
+        assert printed == [
+            "   ✅ Configured cursor",
+            "   ✅ Configured cursor-alias",
+            "   ✅ Configured windsurf",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported_per_platform(self, tmp_path):
+        broken = tmp_path / "broken.json"
+        broken.write_text("{not json")
+        console = Mock()
+        manager = MCPConfigManager(tmp_path, console)
+
+        await manager.inject_global_config(
+            [_platform("claude-desktop", broken), _platform("missing", None)],
+            {"mcp-code-intelligence": {"command": "uv"}},
+        )
+
+        printed = [call.args[0] for call in console.print.call_args_list]
+        assert len(printed) == 1
+        assert printed[0].startswith("   ⚠️  Failed to configure claude-desktop")
+
+
+class TestRuleFiles:
+    """Rule files report whether they were written or already current."""
+
+    def test_rerun_reports_up_to_date(self, tmp_path):
+        console = Mock()
+        manager = MCPConfigManager(tmp_path, console)
+        servers = {"mcp-code-intelligence": {"command": "uv"}}
+
+        for _ in range(2):
+            manager.inject_cursor_rules(servers)
+            manager.inject_universal_rules(servers)
+            manager.inject_copilot_instructions(servers)
+
+        printed = [call.args[0] for call in console.print.call_args_list]
+        assert printed == [
+            "   ✅ Created .cursorrules for AI guidance",
+            "   ✅ Created Universal Rules (.mcp-rules.md)",
+            "   ✅ Created Copilot Instructions (.github/copilot-instructions.md)",
+            "   ✅ .cursorrules already up to date",
+            "   ✅ Universal Rules already up to date",
+            "   ✅ Copilot Instructions already up to date",
+        ]
@@ -137,6 +137,19 @@ class TestChromaVectorDatabase:
         final_stats = await database.get_stats()
         assert final_stats.total_chunks < initial_count
 
+    @pytest.mark.asyncio
+    async def test_iter_chunks_pages_through_collection(
+        self, database, sample_code_chunks
+    ):
+        """Test that iter_chunks yields every stored chunk across pages."""
+        await database.add_chunks(sample_code_chunks)
+
+        all_chunks = await database.get_all_chunks()
+        streamed = [chunk async for chunk in database.iter_chunks(batch_size=1)]
+
+        assert len(streamed) == len(all_chunks)
+        assert {c.chunk_id for c in streamed} == {c.chunk_id for c in all_chunks}
+
     @pytest.mark.asyncio
     async def test_get_stats(self, database, sample_code_chunks):
         """Test getting database statistics."""
@@ -0,0 +1,53 @@
+"""Unit tests for embedding backend selection."""
+
+import pytest
+
+from mcp_code_intelligence.core import embeddings
+from mcp_code_intelligence.core.embeddings import _backend_model_kwargs
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    monkeypatch.delenv("MCP_EMBEDDING_BACKEND", raising=False)
+    monkeypatch.delenv("MCP_EMBEDDING_ONNX_FILE", raising=False)
+    embeddings._default_onnx_int8_file.cache_clear()
+    yield
+    embeddings._default_onnx_int8_file.cache_clear()
+
+
+class TestBackendModelKwargs:
+    """Test cases for _backend_model_kwargs."""
+
+    def test_default_is_stock_backend(self):
+        assert _backend_model_kwargs() == {}
+
+    def test_unknown_backend_falls_back_to_stock(self, monkeypatch):
+        monkeypatch.setenv("MCP_EMBEDDING_BACKEND", "tensorrt")
+
+        assert _backend_model_kwargs() == {}
+
+    def test_onnx(self, monkeypatch):
+        monkeypatch.setenv("MCP_EMBEDDING_BACKEND", "ONNX")
+
+        assert _backend_model_kwargs() == {"backend": "onnx"}
+
+    def test_onnx_int8_uses_file_for_cpu(self, monkeypatch):
+        monkeypatch.setenv("MCP_EMBEDDING_BACKEND", "onnx-int8")
+        monkeypatch.setattr(embeddings.platform, "machine", lambda: "aarch64")
+
+        assert _backend_model_kwargs() == {
+            "backend": "onnx",
+            "model_kwargs": {"file_name": "onnx/model_qint8_arm64.onnx"},
+        }
+
+    def test_onnx_int8_file_override(self, monkeypatch):
+        monkeypatch.setenv("MCP_EMBEDDING_BACKEND", "onnx-int8")
+        monkeypatch.setenv("MCP_EMBEDDING_ONNX_FILE", "onnx/model_quint8_avx2.onnx")
+
+        assert _backend_model_kwargs() == {
+            "backend": "onnx",
+            "model_kwargs": {"file_name": "onnx/model_quint8_avx2.onnx"},
+        }
+
+    def test_default_int8_file_is_a_known_export(self):
+        assert embeddings._default_onnx_int8_file() in embeddings._ONNX_INT8_FILES.values()
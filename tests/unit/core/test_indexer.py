@@ -308,6 +308,23 @@ class TestSemanticIndexer:
         assert all(isinstance(result, bool) for result in results)
         assert any(result for result in results)  # At least one should succeed
 
+    @pytest.mark.asyncio
+    async def test_index_files_with_progress_pipelines_batches(
+        self, mock_database, temp_project_dir
+    ):
+        """Test that pipelined batches yield every file once, in order."""
+        indexer = SemanticIndexer(database=mock_database, project_root=temp_project_dir)
+        indexer.batch_size = 1
+
+        files = sorted(temp_project_dir.glob("*.py"))
+        progress = [
+            item async for item in indexer.index_files_with_progress(files, force_reindex=True)
+        ]
+
+        assert [file_path for file_path, _, _ in progress] == files
+        assert all(success for _, _, success in progress)
+        assert len(mock_database.chunks) == sum(added for _, added, _ in progress)
+
     @pytest.mark.asyncio
     async def test_get_indexing_stats(self, mock_database, temp_project_dir):
         """Test indexing statistics."""
@@ -0,0 +1,77 @@
+"""Unit tests for starting LSP proxies from the config written by setup."""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_code_intelligence.cli.commands.setup.intelligence import IntelligenceManager
+from mcp_code_intelligence.cli.commands.setup.mcp_config import MCPConfigManager
+from mcp_code_intelligence.core.lsp_proxy import LSPManager
+
+# Minimal stdio language server: answers every request with an empty result
+_FAKE_LSP = r"""
+import json, sys
+stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+while True:
+    headers = {}
+    while True:
+        line = stdin.readline()
+        if not line:
+            sys.exit(0)
+        line = line.strip()
+        if not line:
+            break
+        key, value = line.split(b":", 1)
+        headers[key.strip().lower()] = value.strip()
+    msg = json.loads(stdin.read(int(headers[b"content-length"])))
+    if "id" in msg:
+        body = json.dumps({"jsonrpc": "2.0", "id": msg["id"], "result": {}}).encode()
+        stdout.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+        stdout.flush()
+"""
+
+LANGUAGES_DIR = Path(__file__).parents[3] / "src" / "mcp_code_intelligence" / "languages"
+
+
+class TestStartAllFromSetupConfig:
+    """LSPManager.start_all on the .mcp/mcp.json that setup writes."""
+
+    @pytest.mark.asyncio
+    async def test_starts_language_lsps_written_by_setup(self, tmp_path):
+        language_lsps = {"go": {"command": sys.executable, "args": ["-c", _FAKE_LSP]}}
+        MCPConfigManager(tmp_path, Mock()).write_local_config({}, language_lsps)
+
+        manager = LSPManager(tmp_path)
+        try:
+            await manager.start_all()
+
+            assert manager.is_available("go")
+            response = await manager.request("go", "textDocument/hover", {})
+            assert response["result"] == {}
+        finally:
+            await manager.stop_all()
+        assert not manager.is_available("go")
+
+    @pytest.mark.asyncio
+    async def test_missing_lsp_binary_is_skipped(self, tmp_path):
+        language_lsps = {"rust": {"command": str(tmp_path / "no-such-lsp"), "args": []}}
+        MCPConfigManager(tmp_path, Mock()).write_local_config({}, language_lsps)
+
+        manager = LSPManager(tmp_path)
+        await manager.start_all()
+
+        assert manager._load_config() == language_lsps
+        assert not manager.is_available("rust")
+
+    def test_registry_languages_match_language_definitions(self, tmp_path):
+        # languageLsps keys name languages/<key>.json, which the tool registry
+        # reads for display names
+        configs = IntelligenceManager(tmp_path, Mock()).lsp_configs
+
+        languages = [cfg["language"] for cfg in configs.values() if "language" in cfg]
+
+        assert languages
+        for language in languages:
+            assert (LANGUAGES_DIR / f"{language}.json").exists()
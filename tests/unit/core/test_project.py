@@ -0,0 +1,49 @@
+"""Unit tests for ProjectManager directory pruning."""
+
+import pytest
+
+from mcp_code_intelligence.core.project import ProjectManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ProjectManager(tmp_path)
+
+
+class TestShouldIgnoreDir:
+    """Test cases for ProjectManager._should_ignore_dir."""
+
+    @pytest.mark.parametrize("name", ["node_modules", ".venv", ".git", "__pycache__"])
+    def test_default_ignored_names_are_pruned(self, manager, tmp_path, name):
+        assert manager._should_ignore_dir(str(tmp_path), name)
+
+    def test_github_is_kept(self, manager, tmp_path):
+        assert not manager._should_ignore_dir(str(tmp_path), ".github")
+
+    def test_other_hidden_directories_are_kept(self, manager, tmp_path):
+        # Names are matched exactly; the ".*" pattern does not prune dot-dirs
+        assert not manager._should_ignore_dir(str(tmp_path), ".storybook")
+
+    def test_gitignored_directory_is_pruned(self, tmp_path):
+        (tmp_path / ".gitignore").write_text("generated/\n")
+        (tmp_path / "generated").mkdir()
+
+        manager = ProjectManager(tmp_path)
+
+        assert manager._should_ignore_dir(str(tmp_path), "generated")
+
+
+class TestDetectLanguagesWalk:
+    """The walk prunes ignored directories but still enters hidden ones."""
+
+    def test_hidden_directories_are_walked(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("x = 1\n")
+        (tmp_path / ".storybook").mkdir()
+        (tmp_path / ".storybook" / "main.ts").write_text("export {};\n")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "lib.js").write_text("module.exports = {};\n")
+
+        languages = ProjectManager(tmp_path).detect_languages()
+
+        assert sorted(languages) == ["python", "typescript"]
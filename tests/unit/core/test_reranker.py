@@ -0,0 +1,38 @@
+"""Unit tests for the reranker score cache."""
+
+from mcp_code_intelligence.core.services.reranker import _ScoreCache
+
+
+class TestScoreCache:
+    """Test cases for _ScoreCache."""
+
+    def test_hit_after_put(self):
+        cache = _ScoreCache()
+        key = cache.key("query", "def foo(): pass")
+
+        assert cache.get(key) is None
+        cache.put(key, 0.75)
+        assert cache.get(key) == 0.75
+
+    def test_key_distinguishes_query_and_text(self):
+        assert _ScoreCache.key("ab", "c") != _ScoreCache.key("a", "bc")
+
+    def test_evicts_least_recently_used(self):
+        cache = _ScoreCache(maxsize=2)
+        a, b, c = (cache.key("q", t) for t in ("a", "b", "c"))
+
+        cache.put(a, 0.1)
+        cache.put(b, 0.2)
+        cache.get(a)  # a becomes most recently used
+        cache.put(c, 0.3)
+
+        assert cache.get(a) == 0.1
+        assert cache.get(b) is None
+        assert cache.get(c) == 0.3
+
+    def test_expired_entries_are_dropped(self):
+        cache = _ScoreCache(ttl=-1.0)
+        key = cache.key("q", "text")
+
+        cache.put(key, 0.5)
+        assert cache.get(key) is None
@@ -0,0 +1,53 @@
+"""Unit tests for the tool registry's project config cache."""
+
+import json
+import os
+
+import pytest
+
+from mcp_code_intelligence.core import tool_registry
+from mcp_code_intelligence.core.tool_registry import _load_project_config
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    tool_registry._PROJECT_CONFIG_CACHE.clear()
+    yield
+    tool_registry._PROJECT_CONFIG_CACHE.clear()
+
+
+def _write_config(project_root, data, mtime_ns=None):
+    cfg_path = project_root / ".mcp" / "mcp.json"
+    cfg_path.parent.mkdir(exist_ok=True)
+    cfg_path.write_text(json.dumps(data))
+    if mtime_ns is not None:
+        os.utime(cfg_path, ns=(mtime_ns, mtime_ns))
+    return cfg_path
+
+
+class TestLoadProjectConfig:
+    """Test cases for _load_project_config."""
+
+    def test_missing_config_is_empty(self, tmp_path):
+        assert _load_project_config(tmp_path) == {}
+
+    def test_parse_is_reused_until_mtime_changes(self, tmp_path):
+        _write_config(tmp_path, {"languageLsps": {"go": {"command": "gopls"}}}, 1_000_000_000)
+        first = _load_project_config(tmp_path)
+
+        assert _load_project_config(tmp_path) is first
+
+        _write_config(tmp_path, {"languageLsps": {"rust": {"command": "rust-analyzer"}}}, 2_000_000_000)
+
+        assert dict(_load_project_config(tmp_path)["languageLsps"]) == {
+            "rust": {"command": "rust-analyzer"}
+        }
+
+    def test_cached_config_is_read_only(self, tmp_path):
+        _write_config(tmp_path, {"mcpServers": {}})
+        cfg = _load_project_config(tmp_path)
+
+        with pytest.raises(TypeError):
+            cfg["mcpServers"] = {"injected": {}}
+
+        assert _load_project_config(tmp_path) == {"mcpServers": {}}
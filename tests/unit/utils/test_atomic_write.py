@@ -0,0 +1,62 @@
+"""Unit tests for atomic JSON config writes."""
+
+import json
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from mcp_code_intelligence.utils.atomic_write import atomic_write_json
+
+
+class TestAtomicWriteJson:
+    """Unit tests for atomic_write_json."""
+
+    def test_writes_indented_json_with_trailing_newline(self, tmp_path: Path):
+        target = tmp_path / "mcp.json"
+
+        assert atomic_write_json(target, {"mcpServers": {"a": {"command": "x"}}})
+
+        text = target.read_text()
+        assert text.endswith("}\n")
+        assert json.loads(text) == {"mcpServers": {"a": {"command": "x"}}}
+
+    def test_unchanged_content_is_not_rewritten(self, tmp_path: Path):
+        target = tmp_path / "mcp.json"
+        atomic_write_json(target, {"a": 1})
+        mtime = target.stat().st_mtime_ns
+
+        assert atomic_write_json(target, {"a": 1}) is False
+        assert target.stat().st_mtime_ns == mtime
+
+    def test_leaves_no_temp_files(self, tmp_path: Path):
+        target = tmp_path / "mcp.json"
+
+        atomic_write_json(target, {"a": 1})
+        atomic_write_json(target, {"a": 2})
+
+        assert [p.name for p in tmp_path.iterdir()] == ["mcp.json"]
+
+    def test_new_file_gets_default_mode(self, tmp_path: Path):
+        target = tmp_path / "mcp.json"
+
+        atomic_write_json(target, {"a": 1})
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o644
+
+    def test_existing_file_keeps_its_mode(self, tmp_path: Path):
+        target = tmp_path / "mcp.json"
+        target.write_text("{}")
+        target.chmod(0o600)
+
+        atomic_write_json(target, {"a": 1})
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o600
+
+    def test_concurrent_writers_do_not_share_temp_files(self, tmp_path: Path):
+        target = tmp_path / "mcp.json"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: atomic_write_json(target, {"i": i}), range(64)))
+
+        assert json.loads(target.read_text())["i"] in range(64)
+        assert [p.name for p in tmp_path.iterdir()] == ["mcp.json"]